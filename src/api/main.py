@@ -1,6 +1,7 @@
 # VW Crash-to-Repair Simulator
 # FastAPI Application - Main Entry Point
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
@@ -58,10 +59,30 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️ BeamNG.tech not found. Please configure BNG_HOME in config.yaml")
     
+    # Load static dealer/parts data off the event loop so requests never touch disk.
+    # Bad data must not stop the app: on failure the routes load on demand instead.
+    dealer_repo, parts_catalog = await asyncio.gather(
+        asyncio.to_thread(dealers.load_dealer_repo),
+        asyncio.to_thread(estimates.load_parts_catalog),
+        return_exceptions=True
+    )
+    if isinstance(dealer_repo, Exception):
+        logger.error("Failed to load dealer data at startup, loading on demand: %s", dealer_repo)
+        dealer_repo = None
+    else:
+        logger.info("Loaded %d dealers", len(dealer_repo.dealers))
+    if isinstance(parts_catalog, Exception):
+        logger.error("Failed to load parts catalog at startup, loading on demand: %s", parts_catalog)
+        parts_catalog = None
+    else:
+        logger.info("Loaded %d catalog parts", len(parts_catalog.get("parts", {})))
+    
     # Store in app state
     app.state.config = app_config
     app.state.beamng = beamng_simulator  # Legacy
     app.state.vw_beamng_service = vw_beamng_service  # Modern service
+    app.state.dealer_repo = dealer_repo
+    app.state.parts_catalog = parts_catalog
     
     logger.info("✅ API server startup complete - Modern VW service layer initialized")
     
@@ -175,7 +196,9 @@ def main():
         host=config.api.host,
         port=config.api.port,
         reload=config.api.debug,
-        log_level="info"
+        log_level="info",
+        # "auto" picks uvloop when installed; override with API_LOOP=asyncio|uvloop
+        loop=os.getenv("API_LOOP", "auto")
     )
 
 if __name__ == "__main__":
@@ -7,7 +7,8 @@ import logging
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
-from ...models import ServiceAppointment, CustomerInfo, VehicleInfo, AppointmentScheduling, AppointmentStatus
+from ...models import ServiceAppointment, CustomerInfo, VehicleInfo, AppointmentScheduling
+from ...models import APPOINTMENT_STATUSES, STATUS_SCHEDULED
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -41,12 +42,13 @@ async def book_appointment(request: AppointmentBookingRequest) -> Dict[str, Any]
                 detail=f"Invalid dealer ID: {request.dealer_id}"
             )
         
-        # Create appointment ID
-        appointment_id = f"APT_{request.estimate_id}_{int(datetime.now().timestamp())}"
+        # Create appointment ID (booking time also stamps the customer ID)
+        booked_at = int(datetime.now().timestamp())
+        appointment_id = f"APT_{request.estimate_id}_{booked_at}"
         
         # Create customer info
         customer_info = CustomerInfo(
-            customer_id=f"CUST_{int(datetime.now().timestamp())}",
+            customer_id=f"CUST_{booked_at}",
             name=request.customer.get("name", "Demo Customer"),
             email=request.customer.get("email", "demo@vw.com"),
             phone=request.customer.get("phone", "+55 11 99999-9999"),
@@ -87,7 +89,7 @@ async def book_appointment(request: AppointmentBookingRequest) -> Dict[str, Any]
             customer=customer_info,
             vehicle=vehicle_info,
             scheduling=scheduling,
-            status=AppointmentStatus.SCHEDULED
+            status=STATUS_SCHEDULED
         )
         
         logger.info(f"Booked appointment {appointment_id} for customer {customer_info.name}")
@@ -154,11 +156,10 @@ async def update_appointment_status(
     
     try:
         # Validate status
-        valid_statuses = ["scheduled", "in_progress", "completed", "cancelled"]
-        if request.new_status not in valid_statuses:
+        if request.new_status not in APPOINTMENT_STATUSES:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid status. Must be one of: {valid_statuses}"
+                detail=f"Invalid status. Must be one of: {list(APPOINTMENT_STATUSES)}"
             )
         
         # TODO: Implement status update in database
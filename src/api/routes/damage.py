@@ -2,9 +2,10 @@
 # Damage Analysis Routes
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, Optional
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from pydantic import BaseModel
 
 from ...beamng import BeamNGSimulator, DamageExtractor
@@ -13,6 +14,28 @@ from ...models import DamageReport, BeamNGTelemetry, APIResponse, DamageAnalysis
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Simulated front-end collision damage used when no real crash data is available.
+# Read-only so the same payload can be shared by every mock telemetry object.
+_MOCK_DAMAGE_DATA = MappingProxyType({
+    "front_bumper": 0.85,      # Severe damage - needs replacement
+    "hood": 0.45,              # Moderate damage - repairable
+    "left_front_fender": 0.65, # Major damage - likely replacement
+    "right_front_fender": 0.25, # Minor damage - repairable
+    "left_headlight": 0.95,    # Destroyed - replacement
+    "right_headlight": 0.15,   # Minor damage - repairable
+    "windshield": 0.30         # Cracked - replacement
+})
+_MOCK_RAW_DATA = MappingProxyType({"mock": True, "scenario": "front_collision"})
+
+# Static follow-up steps returned by the repair workflow. Kept as a plain dict
+# because the Dict[str, Any] response serializer does not accept mappingproxy;
+# treat it as read-only.
+_WORKFLOW_NEXT_STEPS = {
+    "1": "GET /api/estimates/{damage_report_id} - Generate repair estimate",
+    "2": "GET /api/dealers/search - Find available dealers",
+    "3": "POST /api/appointments - Schedule repair appointment"
+}
+
 # Request/Response models for API
 class DamageExtractionRequest(BaseModel):
     """Request to extract damage data from current BeamNG session"""
@@ -31,14 +54,16 @@ def get_beamng_simulator():
         return request.app.state.beamng
     return _get_simulator
 
+SimulatorDep = Annotated[BeamNGSimulator, Depends(get_beamng_simulator())]
+
 def get_damage_extractor():
     """Dependency to get damage extractor instance"""
     return DamageExtractor()
 
-@router.post("/extract")
+@router.post("/extract", response_model=DamageAnalysisResponse)
 async def extract_damage_telemetry(
     request: DamageExtractionRequest,
-    simulator: BeamNGSimulator = Depends(get_beamng_simulator())
+    simulator: SimulatorDep
 ) -> DamageAnalysisResponse:
     """
     Extract damage telemetry from current BeamNG session.
@@ -58,42 +83,11 @@ async def extract_damage_telemetry(
         )
     
     try:
-        start_time = datetime.now()
-        
-        # Extract telemetry from BeamNG
-        telemetry = simulator.extract_damage_telemetry()
-        
-        if not telemetry:
-            if not request.force_extraction:
-                raise HTTPException(
-                    status_code=404,
-                    detail="No damage telemetry available. Drive and crash the vehicle first, or use force_extraction=true."
-                )
-            else:
-                # Create mock telemetry for testing
-                telemetry = _create_mock_telemetry(simulator.current_session.session_id)
-                logger.info("Created mock telemetry for testing")
-        
-        # Convert to damage report
-        extractor = DamageExtractor()
-        damage_report = extractor.create_damage_report(telemetry, request.vehicle_model_id)
-        
-        # Mark session as having crash detected
-        simulator.current_session.crash_detected = True
-        
-        processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
-        
-        logger.info(f"Extracted damage telemetry for session {simulator.current_session.session_id}")
-        
-        return DamageAnalysisResponse(
-            success=True,
-            message=f"Successfully extracted damage data for {len(damage_report.impact_zones)} impact zones",
-            damage_report=damage_report,
-            processing_time_ms=processing_time
-        )
+        damage_response = await _do_extract(simulator, request.vehicle_model_id, request.force_extraction)
+        return damage_response
         
     except Exception as e:
-        logger.error(f"Error extracting damage telemetry: {e}")
+        logger.error("Error extracting damage telemetry: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Damage extraction error: {str(e)}"
@@ -102,7 +96,7 @@ async def extract_damage_telemetry(
 @router.post("/trigger_repair")
 async def trigger_repair_workflow(
     request: TriggerRepairRequest,
-    simulator: BeamNGSimulator = Depends(get_beamng_simulator())
+    simulator: SimulatorDep
 ) -> Dict[str, Any]:
     """
     Trigger the complete repair workflow - from crash to estimate.
@@ -123,13 +117,8 @@ async def trigger_repair_workflow(
         )
     
     try:
-        # Step 1: Extract damage data
-        extraction_request = DamageExtractionRequest(
-            vehicle_model_id=request.vehicle_model_id,
-            force_extraction=True  # Allow workflow even without real crash
-        )
-        
-        damage_response = await extract_damage_telemetry(extraction_request, simulator)
+        # Step 1: Extract damage data (forced, to allow workflow even without real crash)
+        damage_response = await _do_extract(simulator, request.vehicle_model_id, force_extraction=True)
         
         # Step 2: End the BeamNG session
         simulator.end_session()
@@ -140,11 +129,7 @@ async def trigger_repair_workflow(
             "message": "Repair workflow started - damage extracted and session ended",
             "damage_report_id": damage_response.damage_report.report_id,
             "session_id": simulator.current_session.session_id,
-            "next_steps": {
-                "1": "GET /api/estimates/{damage_report_id} - Generate repair estimate",
-                "2": "GET /api/dealers/search - Find available dealers",
-                "3": "POST /api/appointments - Schedule repair appointment"
-            },
+            "next_steps": _WORKFLOW_NEXT_STEPS,
             "damage_summary": {
                 "crash_severity": damage_response.damage_report.crash_severity,
                 "impact_zones": len(damage_response.damage_report.impact_zones),
@@ -155,7 +140,7 @@ async def trigger_repair_workflow(
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except Exception as e:
-        logger.error(f"Error in repair workflow: {e}")
+        logger.error("Error in repair workflow: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Repair workflow error: {str(e)}"
@@ -188,25 +173,58 @@ async def get_session_damage(session_id: str) -> Dict[str, Any]:
         "note": "In production, this would retrieve damage data from completed sessions"
     }
 
-def _create_mock_telemetry(session_id: str) -> BeamNGTelemetry:
-    """Create mock telemetry for testing when no real crash data available"""
+async def _do_extract(
+    simulator: BeamNGSimulator,
+    vehicle_model_id: str,
+    force_extraction: bool
+) -> DamageAnalysisResponse:
+    """
+    Extract telemetry from the active session and convert it into a damage report.
+    Shared by the extract and trigger_repair endpoints; callers perform the
+    connection/session guard checks.
+    """
+    start_time = datetime.now()
     
-    # Simulate front-end collision damage
-    mock_damage_data = {
-        "front_bumper": 0.85,      # Severe damage - needs replacement
-        "hood": 0.45,              # Moderate damage - repairable
-        "left_front_fender": 0.65, # Major damage - likely replacement
-        "right_front_fender": 0.25, # Minor damage - repairable
-        "left_headlight": 0.95,    # Destroyed - replacement
-        "right_headlight": 0.15,   # Minor damage - repairable
-        "windshield": 0.30         # Cracked - replacement
-    }
+    # Extract telemetry from BeamNG
+    telemetry = simulator.extract_damage_telemetry()
+    
+    if not telemetry:
+        if not force_extraction:
+            raise HTTPException(
+                status_code=404,
+                detail="No damage telemetry available. Drive and crash the vehicle first, or use force_extraction=true."
+            )
+        else:
+            # Create mock telemetry for testing
+            telemetry = _create_mock_telemetry(simulator.current_session.session_id)
+            logger.info("Created mock telemetry for testing")
+    
+    # Convert to damage report
+    extractor = DamageExtractor()
+    damage_report = extractor.create_damage_report(telemetry, vehicle_model_id)
     
+    # Mark session as having crash detected (only on transition, to avoid redundant writes)
+    if not simulator.current_session.crash_detected:
+        simulator.current_session.crash_detected = True
+    
+    processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+    
+    logger.info("Extracted damage telemetry for session %s", simulator.current_session.session_id)
+    
+    return DamageAnalysisResponse(
+        success=True,
+        message=f"Successfully extracted damage data for {len(damage_report.impact_zones)} impact zones",
+        damage_report=damage_report,
+        processing_time_ms=processing_time
+    )
+
+def _create_mock_telemetry(session_id: str) -> BeamNGTelemetry:
+    """Create mock telemetry for testing when no real crash data available"""
     return BeamNGTelemetry(
         session_id=session_id,
         timestamp=datetime.now(),
         vehicle_position=(100.0, 200.0, 1.2),
         vehicle_velocity=0.0,  # Vehicle stopped after crash
-        damage_data=mock_damage_data,
-        raw_data={"mock": True, "scenario": "front_collision"}
-    )
\ No newline at end of file
+        damage_data=_MOCK_DAMAGE_DATA,
+        raw_data=_MOCK_RAW_DATA
+    )
@@ -1,31 +1,164 @@
 # VW Crash-to-Repair Simulator API
 # Dealers Routes
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import Annotated, Dict, Any, FrozenSet, List, Mapping, Optional, Set, Tuple
+import functools
+import hashlib
 import logging
-import json
+import orjson
+from dataclasses import dataclass, field, replace
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 
 from ...models import Dealer, DealerSearchResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_DEALERS_FILE = Path(__file__).resolve().parents[3] / "data" / "dealers" / "vw_brazil_dealers.json"
+
+# Shared read-only defaults for missing keys, so lookups on the request path don't allocate
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_IDS: FrozenSet[str] = frozenset()
+
+# Dealer data only changes when the JSON file does; let clients revalidate via ETag
+_CACHE_CONTROL = "public, max-age=60"
+
+@functools.lru_cache(maxsize=1)
 def load_dealers_data() -> Dict[str, Any]:
-    """Load VW dealers data from JSON file"""
-    dealers_file = Path(__file__).parent.parent.parent.parent / "data" / "dealers" / "vw_brazil_dealers.json"
+    """
+    Load VW dealers data, parsed once per process (treat the result as read-only).
+    Errors propagate, so a failed read is not cached and the next call retries.
+    """
+    return orjson.loads(_DEALERS_FILE.read_bytes())
+
+@dataclass
+class DealerRepo:
+    """
+    Read-only view of the dealers data with lookup indexes built once at load time.
+    City keys are lowercased and state keys are stored as-is (queries are
+    uppercased, so only uppercase states match); search_rank is each dealer's
+    precomputed search sort key.
+    """
+    dealers: Dict[str, Dict[str, Any]]                    # dealer_id -> dealer info
+    inventory: Dict[str, Dict[str, Any]]                  # dealer_id -> inventory info
+    inventory_index: Dict[str, Dict[str, Dict[str, Any]]]  # dealer_id -> part_number -> stock item
+    city_index: Dict[str, Set[str]] = field(default_factory=dict)
+    state_index: Dict[str, Set[str]] = field(default_factory=dict)
+    service_index: Dict[str, Set[str]] = field(default_factory=dict)
+    search_rank: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
+    inventory_summary: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # dealer_id -> stock stats
+    available_parts: Dict[str, FrozenSet[str]] = field(default_factory=dict)  # dealer_id -> in-stock part numbers
+    prebuilt_dealers: Dict[str, Dealer] = field(default_factory=dict)  # Shared; copy before mutating
+    etag: str = ""  # Derived from the data file's mtime; empty when the file is unavailable
+
+def get_dealer_repo(request: Request) -> DealerRepo:
+    """Dependency returning the DealerRepo loaded at startup (built on demand otherwise)"""
+    repo = getattr(request.app.state, "dealer_repo", None)
+    if repo is not None:
+        return repo
     
     try:
-        with open(dealers_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load dealers data: {e}")
-        return {"dealers": {}, "inventory": {}}
+        return load_dealer_repo()
+    except (OSError, orjson.JSONDecodeError) as e:
+        # Serve no dealers while the file is unreadable; nothing is cached, so later requests retry
+        logger.error("Failed to load dealers data: %s", e)
+        return _build_dealer_repo({})
+
+DealerRepoDep = Annotated[DealerRepo, Depends(get_dealer_repo)]
+
+@functools.lru_cache(maxsize=1)
+def load_dealer_repo() -> DealerRepo:
+    """Build the shared DealerRepo, once per process (errors propagate and are not cached)"""
+    repo = _build_dealer_repo(load_dealers_data())
+    
+    try:
+        mtime_ns = _DEALERS_FILE.stat().st_mtime_ns
+        repo.etag = '"' + hashlib.md5(str(mtime_ns).encode(), usedforsecurity=False).hexdigest() + '"'
+    except OSError:
+        pass
+    
+    return repo
 
-@router.get("/search")
+def _build_dealer_repo(dealers_data: Dict[str, Any]) -> DealerRepo:
+    """Build the dealer repository and its indexes from parsed dealers data"""
+    dealers = dealers_data.get("dealers", {})
+    inventory = dealers_data.get("inventory", {})
+    
+    repo = DealerRepo(
+        dealers=dealers,
+        inventory=inventory,
+        inventory_index={
+            dealer_id: {item["part_number"]: item for item in inventory_info.get("stock_items", [])}
+            for dealer_id, inventory_info in inventory.items()
+        }
+    )
+    
+    for dealer_id, inventory_info in inventory.items():
+        stock_items = inventory_info.get("stock_items", [])
+        repo.inventory_summary[dealer_id] = {
+            "total_part_types": len(stock_items),
+            "available_part_types": sum(1 for item in stock_items if item["quantity_available"] > 0),
+            "total_units_in_stock": sum(item["quantity_on_hand"] for item in stock_items),
+            "last_updated": inventory_info.get("last_updated")
+        }
+        repo.available_parts[dealer_id] = frozenset(
+            item["part_number"] for item in stock_items if item["quantity_available"] > 0
+        )
+    
+    for position, (dealer_id, dealer_info) in enumerate(dealers.items()):
+        location = dealer_info["location"]
+        repo.city_index.setdefault(location["city"].lower(), set()).add(dealer_id)
+        repo.state_index.setdefault(location["state"], set()).add(dealer_id)
+        for service in dealer_info["services"]:
+            repo.service_index.setdefault(service, set()).add(dealer_id)
+        repo.prebuilt_dealers[dealer_id] = _create_dealer_object(dealer_id, dealer_info)
+        
+        # Search order: available capacity, then relevant specializations, then file position
+        capacity = dealer_info["capacity"]
+        relevant_specializations = sum(
+            1 for s in dealer_info["specializations"] if "collision" in s or "bodyshop" in s
+        )
+        repo.search_rank[dealer_id] = (
+            capacity["current_workload"] - capacity["max_concurrent_jobs"],
+            relevant_specializations,
+            position
+        )
+    
+    return repo
+
+def _not_modified(request: Request, response: Response, etag: str) -> bool:
+    """
+    Attach ETag/Cache-Control headers for the current dealers data and report
+    whether the client's cached copy (If-None-Match) is still current.
+    """
+    if not etag:
+        return False
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and (
+        if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+    )
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    """ETag/Cache-Control headers for a response built directly by the route"""
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL} if etag else {}
+
+def _not_modified_response(etag: str) -> Response:
+    """Empty 304 response for a client that already holds the current data"""
+    return Response(status_code=304, headers=_cache_headers(etag))
+
+@router.get("/search", response_model=DealerSearchResponse)
 async def search_dealers(
+    request: Request,
+    response: Response,
+    repo: DealerRepoDep,
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state (SP, RJ, etc.)"),
     service_type: Optional[str] = Query(None, description="Required service (bodyshop, collision_repair, etc.)"),
@@ -37,48 +170,44 @@ async def search_dealers(
     Returns dealers that can perform the required services and have parts availability.
     """
     
+    if _not_modified(request, response, repo.etag):
+        return _not_modified_response(repo.etag)
+    
     try:
-        dealers_data = load_dealers_data()
-        all_dealers = dealers_data.get("dealers", {})
-        inventory_data = dealers_data.get("inventory", {})
+        all_dealers = repo.dealers
+        
+        # Normalize query values once; index keys were built to match these at load time
+        city_q = city.lower() if city else None
+        state_q = state.upper() if state else None
+        part_list = [p.strip() for p in parts_needed.split(",")] if parts_needed else []
+        requested_parts = frozenset(part_list)
         
-        # Convert to Dealer objects and filter
+        # Basic filtering: intersect the inverted indexes instead of scanning every dealer
+        candidate_ids = set(all_dealers)
+        if city_q:
+            candidate_ids &= repo.city_index.get(city_q, _EMPTY_IDS)
+        if state_q:
+            candidate_ids &= repo.state_index.get(state_q, _EMPTY_IDS)
+        if service_type:
+            candidate_ids &= repo.service_index.get(service_type, _EMPTY_IDS)
+        
+        # Convert to Dealer objects
         filtered_dealers = []
         
-        for dealer_id, dealer_info in all_dealers.items():
-            # Basic filtering
-            if city and dealer_info["location"]["city"].lower() != city.lower():
-                continue
-                
-            if state and dealer_info["location"]["state"] != state.upper():
-                continue
-                
-            if service_type and service_type not in dealer_info["services"]:
-                continue
-            
+        # Sort by availability and capacity using the precomputed ranks
+        for dealer_id in sorted(candidate_ids, key=repo.search_rank.__getitem__):
             # Check parts availability if requested
             parts_availability = {}
-            if parts_needed:
-                part_list = [p.strip() for p in parts_needed.split(",")]
-                dealer_inventory = inventory_data.get(dealer_id, {}).get("stock_items", [])
-                
-                for part_number in part_list:
-                    available = any(
-                        item["part_number"] == part_number and item["quantity_available"] > 0
-                        for item in dealer_inventory
-                    )
-                    parts_availability[part_number] = available
+            if part_list:
+                in_stock = requested_parts & repo.available_parts.get(dealer_id, _EMPTY_IDS)
+                parts_availability = {part_number: part_number in in_stock for part_number in part_list}
             
-            # Convert to Dealer object (simplified for demo)
-            dealer = _create_dealer_object(dealer_id, dealer_info, parts_availability)
+            # Reuse the prebuilt Dealer; only copy it when attaching per-request availability
+            dealer = repo.prebuilt_dealers[dealer_id]
+            if parts_availability:
+                dealer = replace(dealer, parts_availability=parts_availability)
             filtered_dealers.append(dealer)
         
-        # Sort by availability and capacity
-        filtered_dealers.sort(key=lambda d: (
-            -d.capacity.max_concurrent_jobs + d.capacity.current_workload,  # Available capacity
-            len([s for s in d.specializations if "collision" in s or "bodyshop" in s])  # Relevant specializations
-        ))
-        
         search_criteria = {
             "city": city,
             "state": state,
@@ -87,29 +216,42 @@ async def search_dealers(
             "parts_needed": parts_needed.split(",") if parts_needed else []
         }
         
-        logger.info(f"Found {len(filtered_dealers)} dealers matching criteria")
+        logger.info("Found %d dealers matching criteria", len(filtered_dealers))
         
-        return DealerSearchResponse(
+        search_response = DealerSearchResponse(
             success=True,
             message=f"Found {len(filtered_dealers)} dealers",
             dealers=filtered_dealers,
             search_criteria=search_criteria
         )
         
+        return search_response
+        
     except Exception as e:
-        logger.error(f"Error searching dealers: {e}")
+        logger.error("Error searching dealers: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Dealer search error: {str(e)}"
         )
 
 @router.get("/{dealer_id}")
-async def get_dealer_details(dealer_id: str) -> Dict[str, Any]:
-    """Get detailed information about a specific dealer"""
+async def get_dealer_details(
+    dealer_id: str,
+    request: Request,
+    response: Response,
+    repo: DealerRepoDep,
+    include: Optional[str] = Query(None, description="Set to 'available_parts' to embed the available parts list"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum available parts to embed"),
+    offset: int = Query(0, ge=0, description="Available parts to skip")
+) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific dealer.
+    Only the available parts count is returned unless include=available_parts;
+    the full stock list is served (paginated) by /{dealer_id}/inventory.
+    """
     
     try:
-        dealers_data = load_dealers_data()
-        dealer_info = dealers_data.get("dealers", {}).get(dealer_id)
+        dealer_info = repo.dealers.get(dealer_id)
         
         if not dealer_info:
             raise HTTPException(
@@ -117,20 +259,27 @@ async def get_dealer_details(dealer_id: str) -> Dict[str, Any]:
                 detail=f"Dealer not found: {dealer_id}"
             )
         
+        if _not_modified(request, response, repo.etag):
+            return _not_modified_response(repo.etag)
+        
         # Get inventory information
-        inventory_info = dealers_data.get("inventory", {}).get(dealer_id, {})
+        inventory_info = repo.inventory.get(dealer_id, _EMPTY_DICT)
+        
+        stock_summary = repo.inventory_summary.get(dealer_id)
+        inventory_summary = {
+            "total_parts": stock_summary["total_part_types"] if stock_summary else 0,
+            "last_updated": inventory_info.get("last_updated"),
+            "available_parts_count": stock_summary["available_part_types"] if stock_summary else 0
+        }
+        
+        if include == "available_parts":
+            available_items = (item for item in inventory_info.get("stock_items", ()) if item["quantity_available"] > 0)
+            inventory_summary["available_parts"] = list(islice(available_items, offset, offset + limit))
         
         # Combine dealer and inventory data
         detailed_info = {
             **dealer_info,
-            "inventory_summary": {
-                "total_parts": len(inventory_info.get("stock_items", [])),
-                "last_updated": inventory_info.get("last_updated"),
-                "available_parts": [
-                    item for item in inventory_info.get("stock_items", [])
-                    if item["quantity_available"] > 0
-                ]
-            }
+            "inventory_summary": inventory_summary
         }
         
         return {
@@ -141,19 +290,25 @@ async def get_dealer_details(dealer_id: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting dealer details: {e}")
+        logger.error("Error getting dealer details: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving dealer: {str(e)}"
         )
 
 @router.get("/{dealer_id}/inventory")
-async def get_dealer_inventory(dealer_id: str) -> Dict[str, Any]:
-    """Get current inventory for a specific dealer"""
+async def get_dealer_inventory(
+    dealer_id: str,
+    request: Request,
+    response: Response,
+    repo: DealerRepoDep,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum stock items to return (all when omitted)"),
+    offset: int = Query(0, ge=0, description="Stock items to skip")
+) -> Dict[str, Any]:
+    """Get current inventory for a specific dealer; stock items can be paginated"""
     
     try:
-        dealers_data = load_dealers_data()
-        inventory_info = dealers_data.get("inventory", {}).get(dealer_id)
+        inventory_info = repo.inventory.get(dealer_id)
         
         if not inventory_info:
             raise HTTPException(
@@ -161,28 +316,25 @@ async def get_dealer_inventory(dealer_id: str) -> Dict[str, Any]:
                 detail=f"Inventory not found for dealer: {dealer_id}"
             )
         
-        # Calculate inventory statistics
-        stock_items = inventory_info.get("stock_items", [])
-        total_parts = len(stock_items)
-        available_parts = len([item for item in stock_items if item["quantity_available"] > 0])
-        total_value = sum(item["quantity_on_hand"] for item in stock_items)
+        if _not_modified(request, response, repo.etag):
+            return _not_modified_response(repo.etag)
+        
+        # Summary stats are precomputed for the whole inventory; only the item list is paginated
+        if offset or limit is not None:
+            end = offset + limit if limit is not None else None
+            inventory_info = {**inventory_info, "stock_items": inventory_info.get("stock_items", ())[offset:end]}
         
         return {
             "success": True,
             "dealer_id": dealer_id,
             "inventory": inventory_info,
-            "summary": {
-                "total_part_types": total_parts,
-                "available_part_types": available_parts,
-                "total_units_in_stock": total_value,
-                "last_updated": inventory_info.get("last_updated")
-            }
+            "summary": repo.inventory_summary[dealer_id]
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting dealer inventory: {e}")
+        logger.error("Error getting dealer inventory: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Inventory retrieval error: {str(e)}"
@@ -191,28 +343,24 @@ async def get_dealer_inventory(dealer_id: str) -> Dict[str, Any]:
 @router.post("/{dealer_id}/check_availability")
 async def check_parts_availability(
     dealer_id: str,
-    part_numbers: List[str]
+    part_numbers: List[str],
+    repo: DealerRepoDep
 ) -> Dict[str, Any]:
     """Check availability of specific parts at a dealer"""
     
     try:
-        dealers_data = load_dealers_data()
-        inventory_info = dealers_data.get("inventory", {}).get(dealer_id)
-        
-        if not inventory_info:
+        if not repo.inventory.get(dealer_id):
             raise HTTPException(
                 status_code=404,
                 detail=f"Dealer inventory not found: {dealer_id}"
             )
         
-        stock_items = inventory_info.get("stock_items", [])
+        dealer_index = repo.inventory_index.get(dealer_id, _EMPTY_DICT)
         availability = {}
         
-        for part_number in part_numbers:
-            part_stock = next(
-                (item for item in stock_items if item["part_number"] == part_number),
-                None
-            )
+        # Results are keyed by part number, so look each distinct part up once (order preserved)
+        for part_number in dict.fromkeys(part_numbers):
+            part_stock = dealer_index.get(part_number)
             
             if part_stock:
                 availability[part_number] = {
@@ -243,7 +391,7 @@ async def check_parts_availability(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error checking parts availability: {e}")
+        logger.error("Error checking parts availability: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Availability check error: {str(e)}"
@@ -270,13 +418,10 @@ def _create_dealer_object(dealer_id: str, dealer_info: Dict[str, Any], parts_ava
         contact=contact,
         services=dealer_info["services"],
         specializations=dealer_info["specializations"],
-        capacity=capacity
+        capacity=capacity,
+        parts_availability=parts_availability or None
     )
     
-    # Add parts availability as extra data
-    if parts_availability:
-        dealer.__dict__["parts_availability"] = parts_availability
-    
     return dealer
 
 def _generate_availability_recommendations(availability: Dict[str, Any]) -> List[str]:
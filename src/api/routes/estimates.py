@@ -1,13 +1,15 @@
 # VW Crash-to-Repair Simulator API
 # Repair Estimates Routes
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import Annotated, Dict, Any, List
+import functools
 import logging
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
 from decimal import Decimal
+from types import MappingProxyType
 
 from ...models import RepairEstimate, RepairLineItem, LaborSummary, CostSummary, RepairTimeline
 from ...models import RepairOperation, RepairUrgency, RepairEstimateResponse
@@ -15,46 +17,86 @@ from ...models import RepairOperation, RepairUrgency, RepairEstimateResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Shared read-only default for missing catalog sections, so lookups don't allocate
+_EMPTY_DICT = MappingProxyType({})
+
+_PARTS_FILE = Path(__file__).resolve().parents[3] / "data" / "parts" / "vw_parts_catalog.json"
+
+# Estimated labor hours for component replacement
+_REPLACEMENT_LABOR_HOURS = MappingProxyType({
+    "front_bumper": 3.5,
+    "hood": 2.0,
+    "left_front_fender": 4.0,
+    "right_front_fender": 4.0,
+    "left_headlight": 1.5,
+    "right_headlight": 1.5,
+    "windshield": 2.5,
+    "left_front_door": 5.0,
+    "right_front_door": 5.0
+})
+_DEFAULT_REPLACEMENT_LABOR_HOURS = 3.0
+
+# Repair typically takes 60-80% of replacement time
+_REPAIR_LABOR_FACTOR = 0.7
+_REPAIR_LABOR_HOURS = MappingProxyType({
+    component: hours * _REPAIR_LABOR_FACTOR for component, hours in _REPLACEMENT_LABOR_HOURS.items()
+})
+_DEFAULT_REPAIR_LABOR_HOURS = _DEFAULT_REPLACEMENT_LABOR_HOURS * _REPAIR_LABOR_FACTOR
+
+# Derived money amounts (labor, tax) are rounded to cents once, when final
+_CENTS = Decimal("0.01")
+
 # Load parts catalog data
+@functools.lru_cache(maxsize=1)
 def load_parts_catalog() -> Dict[str, Any]:
-    """Load VW parts catalog from data files"""
-    parts_file = Path(__file__).parent.parent.parent.parent / "data" / "parts" / "vw_parts_catalog.json"
+    """
+    Load VW parts catalog, parsed once per process (treat the result as read-only).
+    Errors propagate, so a failed read is not cached and the next call retries.
+    """
+    return orjson.loads(_PARTS_FILE.read_bytes())
+
+def get_parts_catalog(request: Request) -> Dict[str, Any]:
+    """Dependency returning the parts catalog loaded at startup (loaded on demand otherwise)"""
+    parts_catalog = getattr(request.app.state, "parts_catalog", None)
+    if parts_catalog is not None:
+        return parts_catalog
     
     try:
-        with open(parts_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_parts_catalog()
     except Exception as e:
-        logger.error(f"Failed to load parts catalog: {e}")
+        # Estimate with fallback prices for now; the next request retries the load
+        logger.error("Failed to load parts catalog: %s", e)
         return {"parts": {}, "labor_rates": {}, "paint_materials": {}}
 
-@router.post("/generate/{damage_report_id}")
-async def generate_repair_estimate(damage_report_id: str) -> RepairEstimateResponse:
+PartsCatalogDep = Annotated[Dict[str, Any], Depends(get_parts_catalog)]
+
+@router.post("/generate/{damage_report_id}", response_model=RepairEstimateResponse)
+async def generate_repair_estimate(damage_report_id: str, parts_catalog: PartsCatalogDep) -> RepairEstimateResponse:
     """
     Generate repair estimate from damage report.
     Maps damaged components to VW parts and calculates costs.
     """
     
     try:
-        # Load parts catalog
-        parts_catalog = load_parts_catalog()
-        
         # TODO: Retrieve actual damage report from storage
         # For now, simulate based on damage_report_id
         
         # Create sample estimate based on typical crash scenario
         estimate = await _create_sample_estimate(damage_report_id, parts_catalog)
         
-        logger.info(f"Generated repair estimate for damage report {damage_report_id}")
+        logger.info("Generated repair estimate for damage report %s", damage_report_id)
         
-        return RepairEstimateResponse(
+        estimate_response = RepairEstimateResponse(
             success=True,
             message=f"Repair estimate generated successfully",
             estimate=estimate,
             alternative_options=[]  # TODO: Implement alternative repair options
         )
         
+        return estimate_response
+        
     except Exception as e:
-        logger.error(f"Error generating repair estimate: {e}")
+        logger.error("Error generating repair estimate: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Estimate generation error: {str(e)}"
@@ -89,9 +131,9 @@ async def get_estimates_for_damage(damage_report_id: str) -> Dict[str, Any]:
 async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str, Any]) -> RepairEstimate:
     """Create a sample repair estimate for demonstration"""
     
-    parts = parts_catalog.get("parts", {})
-    labor_rates = parts_catalog.get("labor_rates", {})
-    paint_materials = parts_catalog.get("paint_materials", {})
+    parts = parts_catalog.get("parts", _EMPTY_DICT)
+    labor_rates = parts_catalog.get("labor_rates", _EMPTY_DICT)
+    paint_materials = parts_catalog.get("paint_materials", _EMPTY_DICT)
     
     # Sample damaged components (front-end collision scenario)
     damaged_components = [
@@ -108,7 +150,7 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
     total_labor_hours = 0.0
     
     for part_number, component, operation, quantity, urgency in damaged_components:
-        part_info = parts.get(part_number, {})
+        part_info = parts.get(part_number, _EMPTY_DICT)
         
         if not part_info:
             # Create fallback part info
@@ -146,14 +188,16 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
         total_labor_hours += labor_hours
     
     # Calculate labor costs
-    body_rate = Decimal(str(labor_rates.get("body_repair", {}).get("hourly_rate", 85.00)))
-    complexity_multiplier = Decimal('1.3')  # Moderate complexity
+    body_rate = Decimal(str(labor_rates.get("body_repair", _EMPTY_DICT).get("hourly_rate", 85.00)))
+    complexity_multiplier = 1.3  # Moderate complexity
     
     labor_summary = LaborSummary(
         total_hours=total_labor_hours,
         hourly_rate=body_rate,
         complexity_multiplier=complexity_multiplier,
-        total_labor_cost=body_rate * Decimal(str(total_labor_hours)) * complexity_multiplier
+        total_labor_cost=(
+            body_rate * Decimal(str(total_labor_hours)) * Decimal(str(complexity_multiplier))
+        ).quantize(_CENTS)
     )
     
     # Paint costs (assuming 3 panels need painting)
@@ -162,7 +206,7 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
     # Tax calculation (18% ICMS for São Paulo)
     subtotal = total_parts_cost + labor_summary.total_labor_cost + paint_cost
     tax_rate = 0.18
-    tax_amount = subtotal * Decimal(str(tax_rate))
+    tax_amount = (subtotal * Decimal(str(tax_rate))).quantize(_CENTS)
     grand_total = subtotal + tax_amount
     
     cost_summary = CostSummary(
@@ -176,7 +220,8 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
     )
     
     # Repair timeline
-    estimated_start = datetime.now() + timedelta(days=2)
+    now = datetime.now()
+    estimated_start = now + timedelta(days=2)
     estimated_completion = estimated_start + timedelta(hours=int(total_labor_hours * 1.5))
     
     timeline = RepairTimeline(
@@ -187,10 +232,10 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
     
     # Create final estimate
     estimate = RepairEstimate(
-        estimate_id=f"EST_{damage_report_id}_{int(datetime.now().timestamp())}",
+        estimate_id=f"EST_{damage_report_id}_{int(now.timestamp())}",
         damage_report_id=damage_report_id,
         vehicle_model_id="vw_tcross_2024",
-        created_at=datetime.now(),
+        created_at=now,
         line_items=line_items,
         labor_summary=labor_summary,
         cost_summary=cost_summary,
@@ -201,21 +246,8 @@ async def _create_sample_estimate(damage_report_id: str, parts_catalog: Dict[str
 
 def _get_replacement_labor_hours(component: str) -> float:
     """Get estimated labor hours for component replacement"""
-    labor_estimates = {
-        "front_bumper": 3.5,
-        "hood": 2.0,
-        "left_front_fender": 4.0,
-        "right_front_fender": 4.0,
-        "left_headlight": 1.5,
-        "right_headlight": 1.5,
-        "windshield": 2.5,
-        "left_front_door": 5.0,
-        "right_front_door": 5.0
-    }
-    return labor_estimates.get(component, 3.0)
+    return _REPLACEMENT_LABOR_HOURS.get(component, _DEFAULT_REPLACEMENT_LABOR_HOURS)
 
 def _get_repair_labor_hours(component: str) -> float:
     """Get estimated labor hours for component repair"""
-    # Repair typically takes 60-80% of replacement time
-    replacement_hours = _get_replacement_labor_hours(component)
-    return replacement_hours * 0.7
\ No newline at end of file
+    return _REPAIR_LABOR_HOURS.get(component, _DEFAULT_REPAIR_LABOR_HOURS)
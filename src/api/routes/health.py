@@ -2,8 +2,9 @@
 # Health Check and System Status Routes
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
+import time
 from datetime import datetime
 
 from ...beamng import BeamNGSimulator, check_beamng_installation
@@ -11,6 +12,10 @@ from ...beamng import BeamNGSimulator, check_beamng_installation
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Status endpoints are polled by load balancers; re-stat the BeamNG install at most this often
+_INSTALLATION_CHECK_TTL_S = 5.0
+_installation_checks: Dict[str, Tuple[float, bool]] = {}  # home path -> (checked_at, valid)
+
 def get_beamng_simulator():
     """Dependency to get BeamNG simulator instance from app state"""
     from fastapi import Request
@@ -18,6 +23,17 @@ def get_beamng_simulator():
         return request.app.state.beamng
     return _get_simulator
 
+def _installation_valid(home: str) -> bool:
+    """check_beamng_installation with a short TTL cache per home path"""
+    now = time.monotonic()
+    cached = _installation_checks.get(home)
+    if cached is not None and now - cached[0] < _INSTALLATION_CHECK_TTL_S:
+        return cached[1]
+    
+    valid = check_beamng_installation(home)
+    _installation_checks[home] = (now, valid)
+    return valid
+
 @router.get("/")
 async def health_check() -> Dict[str, Any]:
     """Basic health check endpoint"""
@@ -41,7 +57,7 @@ async def system_status(simulator: BeamNGSimulator = Depends(get_beamng_simulato
     }
     
     if simulator.home:
-        beamng_status["installation_valid"] = check_beamng_installation(simulator.home)
+        beamng_status["installation_valid"] = _installation_valid(simulator.home)
     
     # Overall system health
     overall_status = "healthy"
@@ -73,7 +89,9 @@ async def connect_beamng(simulator: BeamNGSimulator = Depends(get_beamng_simulat
             detail="BeamNG.tech home path not configured. Please set BNG_HOME in config.yaml"
         )
     
-    if not check_beamng_installation(simulator.home):
+    # Always re-check on an explicit connect; this also refreshes the status cache
+    _installation_checks.pop(simulator.home, None)
+    if not _installation_valid(simulator.home):
         raise HTTPException(
             status_code=400,
             detail=f"BeamNG.tech installation not found at {simulator.home}"
@@ -109,7 +127,7 @@ async def connect_beamng(simulator: BeamNGSimulator = Depends(get_beamng_simulat
                 detail="Failed to connect to BeamNG.tech. Make sure BeamNG.tech is running."
             )
     except Exception as e:
-        logger.error(f"Error connecting to BeamNG.tech: {e}")
+        logger.error("Error connecting to BeamNG.tech: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Connection error: {str(e)}"
@@ -127,13 +145,14 @@ async def disconnect_beamng(simulator: BeamNGSimulator = Depends(get_beamng_simu
     
     try:
         simulator.disconnect()
+        _installation_checks.pop(simulator.home, None)
         logger.info("Disconnected from BeamNG.tech")
         return {
             "status": "disconnected",
             "message": "Successfully disconnected from BeamNG.tech"
         }
     except Exception as e:
-        logger.error(f"Error disconnecting from BeamNG.tech: {e}")
+        logger.error("Error disconnecting from BeamNG.tech: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Disconnection error: {str(e)}"
@@ -153,7 +172,7 @@ async def beamng_status(simulator: BeamNGSimulator = Depends(get_beamng_simulato
     }
     
     if simulator.home:
-        status["installation_valid"] = check_beamng_installation(simulator.home)
+        status["installation_valid"] = _installation_valid(simulator.home)
     
     if simulator.current_session:
         status["current_session"] = {
@@ -190,7 +209,7 @@ async def load_vehicle_scenario(
     try:
         success = simulator.load_vw_scenario(vehicle_model.lower())
         if success:
-            logger.info(f"Loaded VW {vehicle_model} scenario")
+            logger.info("Loaded VW %s scenario", vehicle_model)
             return {
                 "status": "scenario_loaded",
                 "message": f"Successfully loaded VW {vehicle_model} scenario",
@@ -204,7 +223,7 @@ async def load_vehicle_scenario(
                 detail=f"Failed to load VW {vehicle_model} scenario"
             )
     except Exception as e:
-        logger.error(f"Error loading scenario: {e}")
+        logger.error("Error loading scenario: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Scenario loading error: {str(e)}"
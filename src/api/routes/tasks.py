@@ -1,40 +1,125 @@
 # Task Management Routes
 # Routes for project task management and Kanban board
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-import json
+from fastapi import APIRouter, HTTPException, Response
+import asyncio
+import logging
+import orjson
 import os
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Get the project root directory
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_TASKS_FILE = PROJECT_ROOT / "tasks.json"
+
+def _read_json(path: Path) -> Dict:
+    """Parse a JSON file with orjson."""
+    return orjson.loads(path.read_bytes())
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    """
+    Replace path with content via an fsynced sibling temp file, so a crash
+    mid-write never leaves a truncated file behind.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# Parsed tasks.json, reused until the file's mtime or size changes. In memory each
+# column's "tasks" is a dict keyed by task id (in file order) rather than the file's
+# list; "index" maps task id -> column name. Serialized response bodies are built lazily
+# from "data" and dropped whenever it changes. "data" is None after a failed write,
+# forcing the next load to re-read the file.
+_CACHE = {
+    "mtime": None, "size": None, "data": None, "index": {},
+    "bytes": None, "column_bytes": {}, "stats_bytes": None
+}
+
+# Serializes moves, so each one is applied and written before the next starts
+_MOVE_LOCK = asyncio.Lock()
+
+def _load_tasks() -> Dict:
+    """Return the parsed tasks file, re-reading it only when it has changed on disk."""
+    st = os.stat(_TASKS_FILE)
+    if (st.st_mtime_ns, st.st_size) != (_CACHE["mtime"], _CACHE["size"]):
+        data = _read_json(_TASKS_FILE)
+        index = {}
+        for column_name, column in data['columns'].items():
+            column['tasks'] = {task['id']: task for task in column['tasks']}
+            index.update(dict.fromkeys(column['tasks'], column_name))
+        # Moves only adjust the statistics by delta, so recount them once per parse
+        # to repair any drift in the file; lastUpdated is left as stored
+        data['statistics'] = count_statistics(data)
+        _CACHE.update(mtime=st.st_mtime_ns, size=st.st_size, data=data, index=index)
+        _invalidate_serialized()
+    return _CACHE["data"]
+
+def _to_file_schema(data: Dict) -> Dict:
+    """Shallow copy of data with each column's tasks back in the file's list form."""
+    return {
+        **data,
+        'columns': {
+            column_name: {**column, 'tasks': list(column['tasks'].values())}
+            for column_name, column in data['columns'].items()
+        }
+    }
+
+def _discard_unsaved() -> None:
+    """Forget the in-memory tasks so the next load re-reads tasks.json from disk."""
+    _CACHE.update(mtime=None, size=None, data=None, index={})
+    _invalidate_serialized()
+
+def _invalidate_serialized() -> None:
+    """Drop cached response bodies after the task data changed."""
+    _CACHE["bytes"] = None
+    _CACHE["column_bytes"] = {}
+    _CACHE["stats_bytes"] = None
+
+# Today's date as stored in tasks.json, re-formatted at most once a minute
+_TODAY_TTL_S = 60.0
+_TODAY = {"checked_at": None, "date": ""}
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD (may lag midnight by up to _TODAY_TTL_S)."""
+    now = time.monotonic()
+    if _TODAY["checked_at"] is None or now - _TODAY["checked_at"] > _TODAY_TTL_S:
+        _TODAY.update(checked_at=now, date=datetime.now().strftime("%Y-%m-%d"))
+    return _TODAY["date"]
+
+def _json_bytes_response(content: bytes) -> Response:
+    """Return already-serialized JSON without another encoding pass."""
+    return Response(content=content, media_type="application/json")
 
 @router.get("/tasks")
 async def get_tasks():
     """Get all tasks from the task management system."""
     try:
-        tasks_file = PROJECT_ROOT / "tasks.json"
-        with open(tasks_file, 'r') as f:
-            data = json.load(f)
-        return JSONResponse(content=data)
+        data = _load_tasks()
+        if _CACHE["bytes"] is None:
+            _CACHE["bytes"] = orjson.dumps(_to_file_schema(data))
+        return _json_bytes_response(_CACHE["bytes"])
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Tasks file not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail="Invalid tasks file format")
 
 @router.get("/tasks/statistics")
 async def get_task_statistics():
     """Get task statistics."""
     try:
-        tasks_file = PROJECT_ROOT / "tasks.json"
-        with open(tasks_file, 'r') as f:
-            data = json.load(f)
-        return JSONResponse(content=data.get('statistics', {}))
+        data = _load_tasks()
+        if _CACHE["stats_bytes"] is None:
+            _CACHE["stats_bytes"] = orjson.dumps(data.get('statistics', {}))
+        return _json_bytes_response(_CACHE["stats_bytes"])
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Tasks file not found")
 
@@ -42,17 +127,13 @@ async def get_task_statistics():
 async def get_task(task_id: str):
     """Get a specific task by ID."""
     try:
-        tasks_file = PROJECT_ROOT / "tasks.json"
-        with open(tasks_file, 'r') as f:
-            data = json.load(f)
+        data = _load_tasks()
         
-        # Find task in all columns
-        for column in data['columns'].values():
-            for task in column['tasks']:
-                if task['id'] == task_id:
-                    return JSONResponse(content=task)
+        column_name = _CACHE["index"].get(task_id)
+        if column_name is None:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         
-        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        return data['columns'][column_name]['tasks'][task_id]
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Tasks file not found")
 
@@ -60,66 +141,106 @@ async def get_task(task_id: str):
 async def get_tasks_by_status(status: str):
     """Get all tasks with a specific status."""
     try:
-        tasks_file = PROJECT_ROOT / "tasks.json"
-        with open(tasks_file, 'r') as f:
-            data = json.load(f)
+        data = _load_tasks()
         
         if status not in data['columns']:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
         
-        return JSONResponse(content=data['columns'][status]['tasks'])
+        column_bytes = _CACHE["column_bytes"]
+        if status not in column_bytes:
+            column_bytes[status] = orjson.dumps(list(data['columns'][status]['tasks'].values()))
+        return _json_bytes_response(column_bytes[status])
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Tasks file not found")
 
 @router.post("/tasks/{task_id}/move/{new_status}")
 async def move_task(task_id: str, new_status: str):
-    """Move a task to a different status."""
-    try:
-        tasks_file = PROJECT_ROOT / "tasks.json"
-        
-        # Read current data
-        with open(tasks_file, 'r') as f:
-            data = json.load(f)
+    """
+    Move a task to a different status.
+    The cached data is updated in place and saved to disk before responding;
+    a failed save returns a 500 and drops the unsaved change.
+    """
+    async with _MOVE_LOCK:
+        try:
+            data = _load_tasks()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Tasks file not found")
         
         # Validate new status
         if new_status not in data['columns']:
             raise HTTPException(status_code=400, detail=f"Invalid status: {new_status}")
         
         # Find and remove task from current column
-        task_found = None
-        for column in data['columns'].values():
-            for i, task in enumerate(column['tasks']):
-                if task['id'] == task_id:
-                    task_found = column['tasks'].pop(i)
-                    break
-            if task_found:
-                break
-        
-        if not task_found:
+        old_column = _CACHE["index"].get(task_id)
+        if old_column is None:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         
+        task_found = data['columns'][old_column]['tasks'].pop(task_id)
+        
         # Update task status and add completion date if moving to done
+        old_status = task_found['status']
         task_found['status'] = new_status
         if new_status == 'done':
-            task_found['completedDate'] = datetime.now().strftime("%Y-%m-%d")
+            task_found['completedDate'] = _today_str()
         
         # Add task to new column
-        data['columns'][new_status]['tasks'].append(task_found)
+        data['columns'][new_status]['tasks'][task_id] = task_found
+        _CACHE["index"][task_id] = new_status
+        _invalidate_serialized()
         
-        # Update statistics
-        update_statistics(data)
+        # Update statistics for this one move; they were recounted when the file was loaded
+        apply_move_delta(data, task_found, old_status, new_status)
         
-        # Save updated data
-        with open(tasks_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Save changes, keeping the file's 2-space indented layout
+        try:
+            content = orjson.dumps(_to_file_schema(data), option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(_atomic_write, _TASKS_FILE, content)
+            st = os.stat(_TASKS_FILE)
+        except Exception as e:
+            logger.error("Failed to write tasks file: %s", e)
+            _discard_unsaved()  # The file on disk is the truth again
+            raise HTTPException(status_code=500, detail=f"Failed to save task move: {str(e)}")
         
-        return JSONResponse(content={"message": f"Task {task_id} moved to {new_status}", "task": task_found})
+        # The cache already holds what was written; record the new stat to skip a re-read
+        _CACHE.update(mtime=st.st_mtime_ns, size=st.st_size)
     
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="Tasks file not found")
+    return {"message": f"Task {task_id} moved to {new_status}", "task": task_found}
+
+# Status -> per-status counter in the statistics block ('review' has none)
+_STATUS_STAT_KEYS = {
+    'done': 'completedTasks',
+    'inProgress': 'inProgressTasks',
+    'todo': 'todoTasks',
+    'backlog': 'backlogTasks'
+}
+
+def apply_move_delta(data: Dict, task: Dict, old_status: str, new_status: str):
+    """Adjust project statistics for a single task changing status."""
+    stats = data['statistics']
+    
+    if old_status != new_status:
+        old_key = _STATUS_STAT_KEYS.get(old_status)
+        new_key = _STATUS_STAT_KEYS.get(new_status)
+        if old_key:
+            stats[old_key] = stats.get(old_key, 0) - 1
+        if new_key:
+            stats[new_key] = stats.get(new_key, 0) + 1
+        
+        if 'done' in (old_status, new_status):
+            hours = task.get('actualHours', task.get('estimatedHours', 0))
+            completed_hours = stats.get('completedHours', 0)
+            stats['completedHours'] = completed_hours + hours if new_status == 'done' else completed_hours - hours
+            stats['remainingHours'] = stats.get('totalEstimatedHours', 0) - stats['completedHours']
+    
+    data['project']['lastUpdated'] = _today_str()
 
 def update_statistics(data: Dict):
-    """Update project statistics."""
+    """Recompute project statistics from every task."""
+    data['statistics'] = count_statistics(data)
+    data['project']['lastUpdated'] = _today_str()
+
+def count_statistics(data: Dict) -> Dict:
+    """Count project statistics from every task."""
     stats = {
         'totalTasks': 0,
         'completedTasks': 0,
@@ -132,7 +253,7 @@ def update_statistics(data: Dict):
     }
     
     for column in data['columns'].values():
-        for task in column['tasks']:
+        for task in column['tasks'].values():
             stats['totalTasks'] += 1
             
             if task['status'] == 'done':
@@ -148,5 +269,4 @@ def update_statistics(data: Dict):
             stats['totalEstimatedHours'] += task.get('estimatedHours', 0)
     
     stats['remainingHours'] = stats['totalEstimatedHours'] - stats['completedHours']
-    data['statistics'] = stats
-    data['project']['lastUpdated'] = datetime.now().strftime("%Y-%m-%d")
\ No newline at end of file
+    return stats
\ No newline at end of file
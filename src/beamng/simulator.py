@@ -2,11 +2,15 @@
 # BeamNG.tech Integration Module
 
 import os
+import functools
+import math
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from bisect import bisect_right
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 
 try:
     from beamngpy import BeamNGpy, Scenario, Vehicle
@@ -20,6 +24,47 @@ from ..models import BeamNGSession, BeamNGTelemetry, DamageReport, ComponentDama
 
 logger = logging.getLogger(__name__)
 
+# BeamNG damage data mapping to VW components
+# This mapping will need refinement based on actual BeamNG data structure
+_COMPONENT_MAPPING = MappingProxyType({
+    # Front end components
+    "bumper_F": "front_bumper",
+    "hood": "hood",
+    "fender_FL": "left_front_fender",
+    "fender_FR": "right_front_fender",
+    "headlight_L": "left_headlight",
+    "headlight_R": "right_headlight",
+
+    # Body components
+    "door_FL": "left_front_door",
+    "door_FR": "right_front_door",
+    "door_RL": "left_rear_door",
+    "door_RR": "right_rear_door",
+    "quarter_L": "left_quarter_panel",
+    "quarter_R": "right_quarter_panel",
+
+    # Rear components
+    "bumper_R": "rear_bumper",
+    "trunk": "trunk_lid",
+    "taillight_L": "left_taillight",
+    "taillight_R": "right_taillight",
+
+    # Mechanical components
+    "engine": "engine_assembly",
+    "transmission": "transmission",
+    "suspension_FL": "left_front_suspension",
+    "suspension_FR": "right_front_suspension",
+    "suspension_RL": "left_rear_suspension",
+    "suspension_RR": "right_rear_suspension",
+
+    # Glass
+    "windshield": "windshield",
+    "window_FL": "left_front_window",
+    "window_FR": "right_front_window",
+    "window_RL": "left_rear_window",
+    "window_RR": "right_rear_window"
+})
+
 class BeamNGSimulator:
     """
     BeamNG.tech simulator interface for VW crash-to-repair experience.
@@ -33,6 +78,7 @@ class BeamNGSimulator:
         self.bng: Optional[BeamNGpy] = None
         self.current_session: Optional[BeamNGSession] = None
         self.connected = False
+        self._active_vehicle: Optional[Vehicle] = None  # Vehicle spawned by load_vw_scenario
         
     def connect(self) -> bool:
         """Connect to BeamNG.tech instance"""
@@ -56,6 +102,7 @@ class BeamNGSimulator:
             try:
                 self.bng.close()
                 self.connected = False
+                self._active_vehicle = None
                 logger.info("Disconnected from BeamNG.tech")
             except Exception as e:
                 logger.error(f"Error disconnecting: {e}")
@@ -109,6 +156,9 @@ class BeamNGSimulator:
             self.bng.scenario.load(scenario)
             self.bng.scenario.start()
             
+            # Keep the handle so telemetry polls don't have to list the scenario's vehicles
+            self._active_vehicle = vehicle
+            
             # Create session tracking
             self.current_session = BeamNGSession(
                 session_id=f"{scenario_name}_{int(time.time())}",
@@ -134,16 +184,19 @@ class BeamNGSimulator:
             return None
             
         try:
-            # Get vehicle reference
-            vehicles = self.bng.vehicles
-            if not vehicles:
-                logger.error("No vehicles in scenario")
-                return None
-                
-            # Get first vehicle (should be our VW test vehicle)
-            vehicle = next(iter(vehicles.values()))
+            # Get vehicle reference, asking BeamNG only when no scenario vehicle is cached
+            vehicle = self._active_vehicle
+            if vehicle is None:
+                vehicles = self.bng.vehicles
+                if not vehicles:
+                    logger.error("No vehicles in scenario")
+                    return None
+                    
+                # Get first vehicle (should be our VW test vehicle)
+                vehicle = next(iter(vehicles.values()))
             
-            # Get damage sensor data
+            # Get damage sensor data. One poll covers every attached sensor, including the
+            # vehicle's built-in state sensor, so vehicle.state needs no separate request.
             vehicle.sensors.poll()
             damage_data = vehicle.sensors.get('damage')
             
@@ -152,7 +205,6 @@ class BeamNGSimulator:
                 return None
             
             # Get vehicle position and state
-            vehicle.update_vehicle()
             position = vehicle.state.get('pos', (0, 0, 0))
             velocity = vehicle.state.get('vel', 0)
             
@@ -180,67 +232,42 @@ class BeamNGSimulator:
         Normalize BeamNG damage data into component damage levels.
         Maps BeamNG internal damage format to our standardized component IDs.
         """
-        normalized = {}
-        
-        # BeamNG damage data mapping to VW components
-        # This mapping will need refinement based on actual BeamNG data structure
-        component_mapping = {
-            # Front end components
-            "bumper_F": "front_bumper",
-            "hood": "hood", 
-            "fender_FL": "left_front_fender",
-            "fender_FR": "right_front_fender",
-            "headlight_L": "left_headlight",
-            "headlight_R": "right_headlight",
-            
-            # Body components  
-            "door_FL": "left_front_door",
-            "door_FR": "right_front_door",
-            "door_RL": "left_rear_door", 
-            "door_RR": "right_rear_door",
-            "quarter_L": "left_quarter_panel",
-            "quarter_R": "right_quarter_panel",
-            
-            # Rear components
-            "bumper_R": "rear_bumper",
-            "trunk": "trunk_lid",
-            "taillight_L": "left_taillight",
-            "taillight_R": "right_taillight",
-            
-            # Mechanical components
-            "engine": "engine_assembly",
-            "transmission": "transmission", 
-            "suspension_FL": "left_front_suspension",
-            "suspension_FR": "right_front_suspension",
-            "suspension_RL": "left_rear_suspension",
-            "suspension_RR": "right_rear_suspension",
-            
-            # Glass
-            "windshield": "windshield",
-            "window_FL": "left_front_window",
-            "window_FR": "right_front_window",
-            "window_RL": "left_rear_window", 
-            "window_RR": "right_rear_window"
+        # Normalize damage values to the 0.0-1.0 range under standardized component IDs
+        return {
+            _COMPONENT_MAPPING[beamng_component]: min(1.0, max(0.0, float(damage_value)))
+            for beamng_component, damage_value in raw_damage.items()
+            if beamng_component in _COMPONENT_MAPPING
         }
-        
-        # Process raw damage data
-        for beamng_component, damage_value in raw_damage.items():
-            # Map to standardized component ID
-            if beamng_component in component_mapping:
-                component_id = component_mapping[beamng_component]
-                # Normalize damage value to 0.0-1.0 range
-                normalized_value = min(1.0, max(0.0, float(damage_value)))
-                normalized[component_id] = normalized_value
-                
-        return normalized
     
     def end_session(self):
         """End current session and mark completion time"""
         if self.current_session:
             self.current_session.end_time = datetime.now()
             self.current_session.crash_detected = True
+            self._active_vehicle = None
             logger.info(f"Ended session: {self.current_session.session_id}")
 
+# Damage type and repairability for each band between the minor/moderate/major
+# thresholds; a component is repairable while its damage level is below the limit
+_DAMAGE_CLASSES = (
+    (DamageType.SCRATCHING, math.inf),
+    (DamageType.DEFORMATION, math.inf),
+    (DamageType.CRACKING, 0.7),  # Some severe cracks not repairable
+    (DamageType.DESTRUCTION, 0.0)
+)
+
+# Simplified impact zoning of standardized component IDs - could be enhanced based on actual crash data
+_FRONT_COMPONENTS = frozenset({"front_bumper", "hood", "left_front_fender", "right_front_fender",
+                               "left_headlight", "right_headlight", "windshield"})
+_REAR_COMPONENTS = frozenset({"rear_bumper", "trunk_lid", "left_taillight", "right_taillight"})
+_SIDE_COMPONENTS = frozenset({"left_front_door", "right_front_door", "left_rear_door", "right_rear_door",
+                              "left_quarter_panel", "right_quarter_panel"})
+_ZONE_OF = MappingProxyType({
+    **dict.fromkeys(_FRONT_COMPONENTS, "front"),
+    **dict.fromkeys(_REAR_COMPONENTS, "rear"),
+    **dict.fromkeys(_SIDE_COMPONENTS, "side")
+})
+
 class DamageExtractor:
     """
     Converts BeamNG telemetry into structured damage reports for parts mapping.
@@ -259,27 +286,22 @@ class DamageExtractor:
         Convert BeamNG telemetry into a structured damage report.
         """
         # Calculate overall crash severity
-        damage_values = list(telemetry.damage_data.values())
-        crash_severity = max(damage_values) if damage_values else 0.0
+        crash_severity = max(telemetry.damage_data.values(), default=0.0)
         
-        # Create component damage entries
+        # Upper bounds of the _DAMAGE_CLASSES bands, for bisecting a damage level;
+        # read per report so changes to damage_thresholds take effect
+        thresholds = self.damage_thresholds
+        class_bounds = (thresholds["minor"], thresholds["moderate"], thresholds["major"])
+        
+        # Create component damage entries, bucketed by impact zone as they are built
         component_damages = []
+        zone_damages: Dict[str, List[ComponentDamage]] = {}
         for component_id, damage_level in telemetry.damage_data.items():
             if damage_level > 0.1:  # Only include components with meaningful damage
                 
                 # Determine damage type based on severity
-                if damage_level < self.damage_thresholds["minor"]:
-                    damage_type = DamageType.SCRATCHING
-                    repairable = True
-                elif damage_level < self.damage_thresholds["moderate"]:
-                    damage_type = DamageType.DEFORMATION  
-                    repairable = True
-                elif damage_level < self.damage_thresholds["major"]:
-                    damage_type = DamageType.CRACKING
-                    repairable = damage_level < 0.7  # Some severe cracks not repairable
-                else:
-                    damage_type = DamageType.DESTRUCTION
-                    repairable = False
+                damage_type, repairable_below = _DAMAGE_CLASSES[bisect_right(class_bounds, damage_level)]
+                repairable = damage_level < repairable_below
                 
                 # Estimate repair time based on damage
                 if repairable:
@@ -296,6 +318,10 @@ class DamageExtractor:
                     confidence=0.85  # AI confidence level
                 )
                 component_damages.append(component_damage)
+                
+                zone = _ZONE_OF.get(component_id)
+                if zone:
+                    zone_damages.setdefault(zone, []).append(component_damage)
         
         # Create damage report
         report = DamageReport(
@@ -306,21 +332,13 @@ class DamageExtractor:
             crash_severity=crash_severity
         )
         
-        # Group components by impact zones for better organization
-        # This is a simplified zoning - could be enhanced based on actual crash data
-        front_components = ["front_bumper", "hood", "left_front_fender", "right_front_fender", 
-                          "left_headlight", "right_headlight", "windshield"]
-        rear_components = ["rear_bumper", "trunk_lid", "left_taillight", "right_taillight"]
-        side_components = ["left_front_door", "right_front_door", "left_rear_door", "right_rear_door",
-                          "left_quarter_panel", "right_quarter_panel"]
-        
         # Create impact zones
         zones = []
         
         # Front impact zone
-        front_damage = [cd for cd in component_damages if cd.component_id in front_components]
+        front_damage = zone_damages.get("front")
         if front_damage:
-            front_severity = max([cd.damage_level for cd in front_damage])
+            front_severity = max(cd.damage_level for cd in front_damage)
             zones.append({
                 "zone_id": "front_impact",
                 "severity": front_severity,
@@ -353,16 +371,23 @@ def check_beamng_installation(home_path: str) -> bool:
     return False
 
 def get_installed_vehicles(home_path: str) -> List[str]:
-    """Get list of installed vehicle models in BeamNG"""
-    vehicles = []
+    """
+    Get list of installed vehicle models in BeamNG.
+    The directory scan is memoized per path; _scan_installed_vehicles.cache_clear() forces a rescan.
+    """
+    return list(_scan_installed_vehicles(home_path))
+
+@functools.lru_cache(maxsize=8)
+def _scan_installed_vehicles(home_path: str) -> Tuple[str, ...]:
+    """Scan the BeamNG vehicles directory (cached; callers get a fresh list)"""
     if not home_path:
-        return vehicles
+        return ()
         
     # Look in vehicles directory (BeamNG structure may vary)
     vehicles_path = Path(home_path) / "content" / "vehicles"
-    if vehicles_path.exists():
-        for vehicle_dir in vehicles_path.iterdir():
-            if vehicle_dir.is_dir():
-                vehicles.append(vehicle_dir.name)
-                
-    return vehicles
\ No newline at end of file
+    if not vehicles_path.exists():
+        return ()
+    
+    # scandir entries know their type from the listing, so no stat per entry
+    with os.scandir(vehicles_path) as entries:
+        return tuple(entry.name for entry in entries if entry.is_dir())
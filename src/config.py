@@ -1,12 +1,18 @@
 # VW Crash-to-Repair Simulator
 # Configuration management
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
 import yaml
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 @dataclass
 class BeamNGConfig:
     """BeamNG.tech configuration"""
@@ -46,8 +52,12 @@ class AppConfig:
     log_level: str = "INFO"
     data_dir: str = "data"
 
+@functools.lru_cache(maxsize=1)
 def load_config(config_path: str = "config/config.yaml") -> AppConfig:
-    """Load configuration from YAML file"""
+    """
+    Load configuration from YAML file.
+    Parsed once per process; call load_config.cache_clear() to pick up edits.
+    """
     
     # Default configuration
     default_beamng_home = os.getenv("BNG_HOME", "")
@@ -91,7 +101,7 @@ def load_config(config_path: str = "config/config.yaml") -> AppConfig:
     
     # Load configuration
     with open(config_file) as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=_SafeLoader)
     
     return AppConfig(
         beamng=BeamNGConfig(**config_data["beamng"]),
@@ -4,28 +4,28 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Literal, Optional, Tuple, Any, get_args
 from enum import Enum
 
 # ============================================================================
 # Vehicle Domain Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     component_id: str       # "front_bumper", "left_headlight"
     name: str              # "Front Bumper"
     assembly_id: str       # Foreign key to assembly
     repairability: float   # 0.0 = replace only, 1.0 = fully repairable
 
-@dataclass
+@dataclass(slots=True)
 class Assembly:
     assembly_id: str        # "front_end", "body_rear", "interior"
     name: str              # "Front End Assembly"
     category: str          # "body", "mechanical", "electrical"
     components: List[Component] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class VehicleModel:
     model_id: str          # "vw_tcross_2024", "vw_golf_mk8"
     brand: str             # "Volkswagen"
@@ -46,14 +46,14 @@ class PartCategory(Enum):
     ELECTRICAL = "electrical"
     CONSUMABLES = "consumables"
 
-@dataclass
+@dataclass(slots=True)
 class PartAvailability:
     in_stock: bool
     lead_time_days: int
     supplier: str
     alternative_parts: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     part_number: str        # "5NA807221AGRU" (VW part number)
     name: str              # "Front Bumper Cover"
@@ -76,7 +76,7 @@ class DamageType(Enum):
     SCRATCHING = "scratching"
     DESTRUCTION = "destruction"
 
-@dataclass
+@dataclass(slots=True)
 class ComponentDamage:
     component_id: str       # Reference to vehicle component
     damage_level: float     # 0.0-1.0 severity
@@ -84,22 +84,24 @@ class ComponentDamage:
     repairable: bool        # Can be repaired vs must replace
     estimated_repair_time: timedelta
     confidence: float = 1.0  # AI confidence in damage assessment
+    vw_part_number: str = "VW-UNKNOWN"      # Mapped VW part, when known
+    repair_category: str = "miscellaneous"  # VW pricing category
 
-@dataclass
+@dataclass(slots=True)
 class ImpactZone:
     zone_id: str            # "front_center", "left_side", "rear_right"
     severity: float         # 0.0 = no damage, 1.0 = total destruction
     impact_type: str        # "collision", "rollover", "side_impact"
     affected_components: List[ComponentDamage] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentalContext:
     impact_speed: float     # km/h
     impact_angle: float     # degrees
     surface_type: str       # "asphalt", "concrete", "gravel"
     weather_conditions: str # "dry", "wet", "icy"
 
-@dataclass
+@dataclass(slots=True)
 class DamageReport:
     report_id: str          # Unique identifier
     session_id: str         # BeamNG session reference
@@ -109,6 +111,18 @@ class DamageReport:
     impact_zones: List[ImpactZone] = field(default_factory=list)
     environmental_factors: Optional[EnvironmentalContext] = None
 
+@dataclass(slots=True)
+class VWDamageReport:
+    session_id: str         # BeamNG session reference
+    vehicle_model: str      # VW model of the session ("tcross", "golf")
+    timestamp: datetime
+    impact_zones: List[Dict[str, Any]]  # Zone analysis: zone, severity, affected_components, vw_impact_type
+    component_damages: List[ComponentDamage]
+    estimated_cost: float   # Total repair cost in BRL
+    repair_complexity: str  # "low", "medium", "high"
+    vw_parts_required: List[Dict[str, Any]] = field(default_factory=list)
+    processing_metadata: Dict[str, Any] = field(default_factory=dict)
+
 # ============================================================================
 # Repair Domain Models
 # ============================================================================
@@ -125,7 +139,7 @@ class RepairUrgency(Enum):
     RECOMMENDED = "recommended" # Important for proper operation
     OPTIONAL = "optional"      # Cosmetic or minor issues
 
-@dataclass
+@dataclass(slots=True)
 class RepairLineItem:
     item_id: str
     part_number: str        # Reference to Part
@@ -137,14 +151,14 @@ class RepairLineItem:
     urgency: RepairUrgency
     description: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class LaborSummary:
     total_hours: float
     hourly_rate: Decimal
     complexity_multiplier: float  # 1.0 = standard, >1.0 = complex
     total_labor_cost: Decimal
 
-@dataclass
+@dataclass(slots=True)
 class CostSummary:
     parts_subtotal: Decimal
     labor_subtotal: Decimal
@@ -154,13 +168,13 @@ class CostSummary:
     grand_total: Decimal
     currency: str
 
-@dataclass
+@dataclass(slots=True)
 class RepairTimeline:
     estimated_start: datetime
     estimated_completion: datetime
     critical_path_items: List[str] = field(default_factory=list)  # Part numbers on critical path
 
-@dataclass
+@dataclass(slots=True)
 class RepairEstimate:
     estimate_id: str
     damage_report_id: str
@@ -175,7 +189,7 @@ class RepairEstimate:
 # Dealer Domain Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DealerLocation:
     address: str
     city: str
@@ -185,20 +199,20 @@ class DealerLocation:
     longitude: float
     service_radius_km: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContactInfo:
     phone: str
     email: str
     website: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ServiceCapacity:
     max_concurrent_jobs: int
     current_workload: int
     average_completion_time: timedelta
     next_available_slot: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InventoryItem:
     part_number: str
     quantity_on_hand: int
@@ -207,13 +221,13 @@ class InventoryItem:
     last_restocked: datetime
     reorder_point: int
 
-@dataclass
+@dataclass(slots=True)
 class DealerInventory:
     dealer_id: str
     last_updated: datetime
     stock_items: List[InventoryItem] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Dealer:
     dealer_id: str          # "VW_SP_001", "VW_RJ_042"
     name: str               # "Volkswagen São Paulo Centro"
@@ -225,18 +239,21 @@ class Dealer:
     specializations: List[str]  # ["collision_repair", "paint", "electrical"]
     capacity: ServiceCapacity
     inventory: Optional[DealerInventory] = None
+    parts_availability: Optional[Dict[str, bool]] = None  # Part number -> in stock, when parts were requested
 
 # ============================================================================
 # Appointment Domain Models
 # ============================================================================
 
-class AppointmentStatus(Enum):
-    SCHEDULED = "scheduled"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
+# Appointment statuses are plain strings, which serialize without an Enum lookup
+AppointmentStatus = Literal["scheduled", "in_progress", "completed", "cancelled"]
+APPOINTMENT_STATUSES: Tuple[str, ...] = get_args(AppointmentStatus)
+STATUS_SCHEDULED = "scheduled"
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+STATUS_CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CustomerInfo:
     customer_id: str
     name: str
@@ -244,7 +261,7 @@ class CustomerInfo:
     phone: str
     preferred_contact: str  # "email", "sms", "phone"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VehicleInfo:
     vin: Optional[str]      # Vehicle identification number
     model_id: str           # Reference to VehicleModel
@@ -252,7 +269,7 @@ class VehicleInfo:
     color: str
     license_plate: str
 
-@dataclass
+@dataclass(slots=True)
 class AppointmentScheduling:
     scheduled_date: datetime
     estimated_duration: timedelta
@@ -260,14 +277,14 @@ class AppointmentScheduling:
     bay_assignment: str     # "Bay 3", "Paint Booth A"
     special_instructions: str = ""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusChange:
     timestamp: datetime
     old_status: AppointmentStatus
     new_status: AppointmentStatus
     notes: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ServiceAppointment:
     appointment_id: str
     estimate_id: str        # Reference to repair estimate
@@ -276,13 +293,13 @@ class ServiceAppointment:
     vehicle: VehicleInfo
     scheduling: AppointmentScheduling
     status: AppointmentStatus
-    status_history: List[StatusChange] = field(default_factory=list)
+    status_history: List[StatusChange] = field(default_factory=list)  # Full audit trail, never truncated
 
 # ============================================================================
 # BeamNG Integration Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BeamNGSession:
     session_id: str
     vehicle_model: str
@@ -291,7 +308,7 @@ class BeamNGSession:
     end_time: Optional[datetime] = None
     crash_detected: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BeamNGTelemetry:
     session_id: str
     timestamp: datetime
@@ -304,24 +321,24 @@ class BeamNGTelemetry:
 # API Response Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse:
     success: bool
     message: str
     data: Optional[Any] = None
     error_code: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DamageAnalysisResponse(APIResponse):
     damage_report: Optional[DamageReport] = None
     processing_time_ms: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class RepairEstimateResponse(APIResponse):
     estimate: Optional[RepairEstimate] = None
     alternative_options: List[RepairEstimate] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class DealerSearchResponse(APIResponse):
     dealers: List[Dealer] = field(default_factory=list)
     search_criteria: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
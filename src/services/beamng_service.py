@@ -4,10 +4,15 @@ Migrated from the original BeamNG simulator with enhanced architecture
 """
 
 import asyncio
+import functools
+from bisect import bisect_right
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 import json
 
 try:
@@ -18,10 +23,99 @@ except ImportError:
     BEAMNGPY_AVAILABLE = False
     logging.warning("BeamNGpy not available. Install with: pip install beamngpy")
 
-from ..models import BeamNGSession, BeamNGTelemetry, DamageReport, ComponentDamage, DamageType
+from ..models import BeamNGSession, BeamNGTelemetry, VWDamageReport, ComponentDamage, DamageType
 
 logger = logging.getLogger(__name__)
 
+# VW-specific component mapping: zone -> component name fragments (lowercase),
+# fuzzy-matched against BeamNG damage keys
+_VW_COMPONENT_ZONES = MappingProxyType({
+    "front": ("hood", "front_bumper", "headlight", "grille", "front_quarter"),
+    "rear": ("trunk", "rear_bumper", "taillight", "rear_quarter"),
+    "side_left": ("left_door", "left_mirror", "left_quarter", "left_window"),
+    "side_right": ("right_door", "right_mirror", "right_quarter", "right_window"),
+    "roof": ("roof", "sunroof", "roof_rail"),
+    "underbody": ("chassis", "exhaust", "suspension")
+})
+
+# VW scenario configurations: vehicle model -> scenario type -> config
+_VW_SCENARIOS = MappingProxyType({
+    "tcross": MappingProxyType({
+        "crash_test": MappingProxyType({
+            "scenario_name": "vw_tcross_crash_test_v2",
+            "beamng_vehicle": "tcross",
+            "map_name": "west_coast_usa",
+            "spawn_position": (-717, 101, 118),
+            "spawn_rotation": (0, 0, 0.3826834, 0.9238795)
+        })
+    }),
+    "golf": MappingProxyType({
+        "crash_test": MappingProxyType({
+            "scenario_name": "vw_golf_crash_test_v2",
+            "beamng_vehicle": "golf",
+            "map_name": "west_coast_usa",
+            "spawn_position": (-500, 200, 120),
+            "spawn_rotation": (0, 0, 0, 1)
+        })
+    })
+})
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# VW parts catalog mapping: component name fragment (lowercase) -> part info
+_VW_PARTS_MAP = MappingProxyType({
+    "hood": MappingProxyType({"part_code": "VW-HOOD-001", "category": "body_panel"}),
+    "front_bumper": MappingProxyType({"part_code": "VW-FBMP-001", "category": "bumper"}),
+    "headlight": MappingProxyType({"part_code": "VW-HDLT-001", "category": "lighting"}),
+    "door": MappingProxyType({"part_code": "VW-DOOR-001", "category": "body_panel"}),
+    "trunk": MappingProxyType({"part_code": "VW-TRNK-001", "category": "body_panel"})
+})
+_DEFAULT_VW_PART = MappingProxyType({"part_code": "VW-MISC-001", "category": "miscellaneous"})
+
+# VW Brazil pricing (in Reais) per repair category
+# (base part cost in BRL, labor hours) per repair category, at full severity
+_VW_PRICING = MappingProxyType({
+    "body_panel": (1200.0, 4.0),
+    "bumper": (800.0, 2.5),
+    "lighting": (450.0, 1.5),
+    "miscellaneous": (300.0, 1.0)
+})
+_DEFAULT_VW_PRICING = _VW_PRICING["miscellaneous"]
+_LABOR_RATE_BRL = 85.0  # Brazilian labor rate per hour
+
+# Zones above this severity have structural (deformation) damage, the rest cosmetic
+_VW_STRUCTURAL_SEVERITY = 0.5
+# Components in zones at or above this severity are replaced rather than repaired
+_VW_REPLACE_SEVERITY = 0.8
+_VW_REPLACEMENT_HOURS = 2
+
+# VW impact type for each band between the severity thresholds (a threshold
+# value itself falls in the band above it)
+_VW_IMPACT_THRESHOLDS = (0.2, 0.5, 0.8)
+_VW_IMPACT_TYPES = ("minor_cosmetic", "moderate_structural", "major_structural", "critical_safety")
+
+@functools.lru_cache(maxsize=1024)
+def _vw_part_for_component(component_name: str) -> Mapping[str, str]:
+    """First VW part whose name fragment occurs in component_name, else the default part"""
+    # Fuzzy matching for VW parts
+    name = component_name.lower()
+    for vw_part, part_info in _VW_PARTS_MAP.items():
+        if vw_part in name:
+            return part_info
+    
+    # Default fallback
+    return _DEFAULT_VW_PART
+
+@functools.lru_cache(maxsize=1024)
+def _vw_zone_matches(damage_key: str) -> Tuple[Tuple[str, int], ...]:
+    """(zone, component position) for every zone component contained in damage_key"""
+    key = damage_key.lower()
+    return tuple(
+        (zone_name, component_position)
+        for zone_name, components in _VW_COMPONENT_ZONES.items()
+        for component_position, component in enumerate(components)
+        if component in key
+    )
+
 class VWBeamNGService:
     """
     Modern async BeamNG service for VW vehicle simulations.
@@ -38,6 +132,7 @@ class VWBeamNGService:
         self.connected = False
         self._connection_attempts = 0
         self._max_retries = 3
+        self._executor: Optional[ThreadPoolExecutor] = None  # See _get_executor
         
     async def connect(self) -> bool:
         """
@@ -53,15 +148,15 @@ class VWBeamNGService:
                 logger.info(f"Connecting to BeamNG.tech (attempt {attempt + 1}/{self._max_retries})...")
                 
                 # Run BeamNG connection in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 self.bng = await loop.run_in_executor(
-                    None, 
+                    self._get_executor(), 
                     lambda: BeamNGpy(self.host, self.port, home=self.home)
                 )
                 
                 # Open connection with timeout
                 await asyncio.wait_for(
-                    loop.run_in_executor(None, self.bng.open),
+                    loop.run_in_executor(self._get_executor(), self.bng.open),
                     timeout=10.0
                 )
                 
@@ -93,9 +188,15 @@ class VWBeamNGService:
                 if self.current_session:
                     await self.end_session()
                 
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self.bng.close)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._get_executor(), self.bng.close)
                 self.connected = False
+                
+                # Drop the pool first so later calls start a fresh one; wait for
+                # any queued BeamNG work off the event loop
+                executor, self._executor = self._executor, None
+                if executor is not None:
+                    await asyncio.to_thread(executor.shutdown)
                 logger.info("Disconnected from BeamNG.tech")
                 
             except Exception as e:
@@ -115,13 +216,8 @@ class VWBeamNGService:
         
         if self.connected and self.bng:
             try:
-                # Check if BeamNG is responsive
-                loop = asyncio.get_event_loop()
-                vehicles_count = await loop.run_in_executor(
-                    None, 
-                    lambda: len(self.bng.vehicles) if hasattr(self.bng, 'vehicles') else 0
-                )
-                status["vehicles_loaded"] = vehicles_count
+                # Check if BeamNG is responsive (reads local client state, so no thread hop)
+                status["vehicles_loaded"] = len(self.bng.vehicles) if hasattr(self.bng, 'vehicles') else 0
                 status["responsive"] = True
                 
             except Exception as e:
@@ -149,21 +245,22 @@ class VWBeamNGService:
             logger.info(f"Loading VW {vehicle_model} scenario: {scenario_config['scenario_name']}")
             
             # Load scenario asynchronously
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success = await loop.run_in_executor(
-                None, 
+                self._get_executor(), 
                 self._load_scenario_sync, 
                 scenario_config
             )
             
             if success:
                 # Create enhanced session tracking
-                session_id = f"vw_{vehicle_model}_{scenario_type}_{int(datetime.now().timestamp())}"
+                start_time = datetime.now()
+                session_id = f"vw_{vehicle_model}_{scenario_type}_{int(start_time.timestamp())}"
                 self.current_session = BeamNGSession(
                     session_id=session_id,
                     vehicle_model=vehicle_model,
                     scenario=scenario_config["scenario_name"],
-                    start_time=datetime.now()
+                    start_time=start_time
                 )
                 
                 logger.info(f"✅ VW {vehicle_model} scenario loaded successfully - Session: {session_id}")
@@ -183,7 +280,7 @@ class VWBeamNGService:
             raise ValueError("No active session - load a scenario first")
         
         try:
-            simulation_start = datetime.now()
+            simulation_start = time.perf_counter_ns()
             crash_params = crash_params or {"type": "frontal", "speed": 50}
             
             logger.info(f"Executing crash simulation: {crash_params}")
@@ -199,7 +296,7 @@ class VWBeamNGService:
                 "simulation_id": f"{self.current_session.session_id}_crash",
                 "crash_type": crash_params.get("type", "unknown"),
                 "impact_speed": crash_params.get("speed", 0),
-                "duration_ms": int((datetime.now() - simulation_start).total_seconds() * 1000),
+                "duration_ms": (time.perf_counter_ns() - simulation_start) // 1_000_000,
                 "success": True,
                 "timestamp": datetime.now().isoformat()
             }
@@ -211,9 +308,10 @@ class VWBeamNGService:
             logger.error(f"Failed to execute crash simulation: {e}")
             raise
     
-    async def extract_damage_telemetry(self) -> Optional[BeamNGTelemetry]:
+    async def extract_damage_telemetry(self, keep_raw: bool = False) -> Optional[BeamNGTelemetry]:
         """
-        Extract damage telemetry with component-level analysis
+        Extract damage telemetry with component-level analysis.
+        The raw BeamNG payload is only kept on the telemetry when keep_raw is set.
         """
         if not self.connected or not self.current_session:
             logger.error("No active BeamNG session for telemetry extraction")
@@ -223,9 +321,9 @@ class VWBeamNGService:
             logger.info("Extracting damage telemetry from BeamNG...")
             
             # Extract telemetry in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             raw_telemetry = await loop.run_in_executor(
-                None, 
+                self._get_executor(), 
                 self._extract_telemetry_sync
             )
             
@@ -234,7 +332,7 @@ class VWBeamNGService:
                 return None
             
             # Process telemetry data
-            processed_telemetry = await self._process_telemetry_data(raw_telemetry)
+            processed_telemetry = await self._process_telemetry_data(raw_telemetry, keep_raw)
             
             logger.info(f"Telemetry extracted successfully - {len(processed_telemetry.damage_data)} damage points")
             return processed_telemetry
@@ -243,7 +341,7 @@ class VWBeamNGService:
             logger.error(f"Failed to extract damage telemetry: {e}")
             return None
     
-    async def generate_vw_damage_report(self, telemetry: BeamNGTelemetry) -> DamageReport:
+    async def generate_vw_damage_report(self, telemetry: BeamNGTelemetry) -> VWDamageReport:
         """
         Generate comprehensive VW-specific damage report
         """
@@ -253,14 +351,11 @@ class VWBeamNGService:
             # Analyze damage patterns specific to VW vehicles
             damage_analysis = await self._analyze_vw_damage_patterns(telemetry)
             
-            # Map to VW component structure
-            vw_components = await self._map_to_vw_components(damage_analysis)
-            
-            # Calculate VW-specific repair costs
-            repair_estimate = await self._calculate_vw_repair_costs(vw_components)
+            # Map to VW component structure and calculate VW-specific repair costs
+            vw_components, repair_estimate = await self._build_vw_components_and_costs(damage_analysis)
             
             # Generate comprehensive damage report
-            damage_report = DamageReport(
+            damage_report = VWDamageReport(
                 session_id=telemetry.session_id,
                 vehicle_model=self.current_session.vehicle_model,
                 timestamp=datetime.now(),
@@ -294,32 +389,20 @@ class VWBeamNGService:
             self.current_session = None
     
     # Private helper methods
-    def _get_vw_scenario_config(self, vehicle_model: str, scenario_type: str) -> Optional[Dict[str, str]]:
-        """Get VW scenario configuration"""
-        vw_scenarios = {
-            "tcross": {
-                "crash_test": {
-                    "scenario_name": "vw_tcross_crash_test_v2",
-                    "beamng_vehicle": "tcross",
-                    "map_name": "west_coast_usa",
-                    "spawn_position": (-717, 101, 118),
-                    "spawn_rotation": (0, 0, 0.3826834, 0.9238795)
-                }
-            },
-            "golf": {
-                "crash_test": {
-                    "scenario_name": "vw_golf_crash_test_v2",
-                    "beamng_vehicle": "golf",
-                    "map_name": "west_coast_usa", 
-                    "spawn_position": (-500, 200, 120),
-                    "spawn_rotation": (0, 0, 0, 1)
-                }
-            }
-        }
-        
-        return vw_scenarios.get(vehicle_model.lower(), {}).get(scenario_type)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool for blocking BeamNGpy calls, kept apart from the loop's default
+        executor. A single worker, since the BeamNGpy client is not thread-safe.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="beamng")
+        return self._executor
+    
+    def _get_vw_scenario_config(self, vehicle_model: str, scenario_type: str) -> Optional[Mapping[str, Any]]:
+        """Get VW scenario configuration (shared and read-only)"""
+        return _VW_SCENARIOS.get(vehicle_model.lower(), _EMPTY_MAPPING).get(scenario_type)
     
-    def _load_scenario_sync(self, config: Dict[str, Any]) -> bool:
+    def _load_scenario_sync(self, config: Mapping[str, Any]) -> bool:
         """Synchronous scenario loading (runs in thread pool)"""
         try:
             # Create new scenario
@@ -388,7 +471,7 @@ class VWBeamNGService:
             logger.error(f"Failed to extract telemetry synchronously: {e}")
             return None
     
-    async def _process_telemetry_data(self, raw_data: Dict[str, Any]) -> BeamNGTelemetry:
+    async def _process_telemetry_data(self, raw_data: Dict[str, Any], keep_raw: bool = False) -> BeamNGTelemetry:
         """Process and normalize raw telemetry data"""
         # Normalize damage data format
         normalized_damage = self._normalize_damage_data(raw_data["damage_data"])
@@ -399,7 +482,11 @@ class VWBeamNGService:
             vehicle_position=raw_data["position"],
             vehicle_velocity=raw_data["velocity"],
             damage_data=normalized_damage,
-            raw_data=raw_data
+            # Copy without what the telemetry already carries in its own fields;
+            # the caller's dict is left untouched
+            raw_data={
+                key: value for key, value in raw_data.items() if key not in ("damage_data", "timestamp")
+            } if keep_raw else {}
         )
         
         return telemetry
@@ -409,50 +496,46 @@ class VWBeamNGService:
         normalized = {}
         
         for component, damage_value in raw_damage.items():
-            # Convert damage value to normalized 0.0-1.0 scale
-            if isinstance(damage_value, (int, float)):
-                normalized_value = max(0.0, min(1.0, float(damage_value)))
-                normalized[component] = normalized_value
-            elif isinstance(damage_value, dict):
+            if isinstance(damage_value, dict):
                 # Handle complex damage objects
-                damage_level = damage_value.get('damage', 0.0)
-                normalized[component] = max(0.0, min(1.0, float(damage_level)))
+                damage_value = damage_value.get('damage', 0.0)
+            elif not isinstance(damage_value, (int, float)):
+                continue
+            
+            # Convert damage value to normalized 0.0-1.0 scale
+            normalized[component] = max(0.0, min(1.0, float(damage_value)))
         
         return normalized
     
     async def _analyze_vw_damage_patterns(self, telemetry: BeamNGTelemetry) -> Dict[str, Any]:
         """Analyze damage patterns specific to VW vehicle architecture"""
-        # VW-specific component mapping
-        vw_component_zones = {
-            "front": ["hood", "front_bumper", "headlight", "grille", "front_quarter"],
-            "rear": ["trunk", "rear_bumper", "taillight", "rear_quarter"],
-            "side_left": ["left_door", "left_mirror", "left_quarter", "left_window"],
-            "side_right": ["right_door", "right_mirror", "right_quarter", "right_window"],
-            "roof": ["roof", "sunroof", "roof_rail"],
-            "underbody": ["chassis", "exhaust", "suspension"]
-        }
+        # Collect each zone's hits in one pass over the damage data. Sorting by
+        # (component position in the zone, damage key position) keeps
+        # affected_components in the same order as a per-component scan.
+        zone_hits: Dict[str, List[Tuple[int, int, str, float]]] = {}
+        for key_position, (damage_key, damage_level) in enumerate(telemetry.damage_data.items()):
+            for zone_name, component_position in _vw_zone_matches(damage_key):
+                zone_hits.setdefault(zone_name, []).append((component_position, key_position, damage_key, damage_level))
         
         impact_zones = []
         overall_severity = 0.0
         
-        for zone_name, components in vw_component_zones.items():
-            zone_damage = 0.0
-            affected_components = []
-            
-            for component in components:
-                # Check for component damage (fuzzy matching)
-                for damage_key, damage_level in telemetry.damage_data.items():
-                    if component.lower() in damage_key.lower():
-                        zone_damage = max(zone_damage, damage_level)
-                        if damage_level > 0.1:  # Significant damage threshold
-                            affected_components.append(damage_key)
+        for zone_name in _VW_COMPONENT_ZONES:
+            hits = zone_hits.get(zone_name)
+            if not hits:
+                continue
+            hits.sort()
+            
+            zone_damage = max(0.0, max(hit[3] for hit in hits))
+            # Only components above the significant damage threshold are listed
+            affected_components = [damage_key for _, _, damage_key, damage_level in hits if damage_level > 0.1]
             
             if zone_damage > 0.05:  # Zone damage threshold
                 impact_zones.append({
                     "zone": zone_name,
                     "severity": zone_damage,
                     "affected_components": affected_components,
-                    "vw_impact_type": self._classify_vw_impact_type(zone_name, zone_damage)
+                    "vw_impact_type": _VW_IMPACT_TYPES[bisect_right(_VW_IMPACT_THRESHOLDS, zone_damage)]
                 })
                 
                 overall_severity = max(overall_severity, zone_damage)
@@ -463,17 +546,6 @@ class VWBeamNGService:
             "damage_distribution": self._calculate_damage_distribution(impact_zones)
         }
     
-    def _classify_vw_impact_type(self, zone: str, severity: float) -> str:
-        """Classify impact type for VW-specific repair procedures"""
-        if severity < 0.2:
-            return "minor_cosmetic"
-        elif severity < 0.5:
-            return "moderate_structural" 
-        elif severity < 0.8:
-            return "major_structural"
-        else:
-            return "critical_safety"
-    
     def _calculate_damage_distribution(self, impact_zones: List[Dict]) -> Dict[str, float]:
         """Calculate damage distribution across vehicle zones"""
         total_zones = len(impact_zones) if impact_zones else 1
@@ -506,86 +578,59 @@ class VWBeamNGService:
         
         return distribution
     
-    async def _map_to_vw_components(self, damage_analysis: Dict) -> List[ComponentDamage]:
-        """Map damage to VW-specific component structure"""
-        vw_components = []
+    async def _build_vw_components_and_costs(self, damage_analysis: Dict) -> Tuple[List[ComponentDamage], Dict[str, Any]]:
+        """
+        Map damaged components to the VW component structure and price their repair
+        with VW parts pricing, in a single pass over the impact zones.
+        """
+        start_time = time.perf_counter_ns()
         
-        # VW parts catalog mapping
-        vw_parts_map = {
-            "hood": {"part_code": "VW-HOOD-001", "category": "body_panel"},
-            "front_bumper": {"part_code": "VW-FBMP-001", "category": "bumper"},
-            "headlight": {"part_code": "VW-HDLT-001", "category": "lighting"},
-            "door": {"part_code": "VW-DOOR-001", "category": "body_panel"},
-            "trunk": {"part_code": "VW-TRNK-001", "category": "body_panel"}
-        }
+        vw_components = []
+        total_parts_cost = 0.0
+        total_labor_hours = 0.0
+        parts_list = []
         
         for zone in damage_analysis["impact_zones"]:
+            severity = zone["severity"]
+            # Damage classification is shared by every component in the zone
+            damage_type = DamageType.DEFORMATION if severity > _VW_STRUCTURAL_SEVERITY else DamageType.SCRATCHING
+            repairable = severity < _VW_REPLACE_SEVERITY
+            repair_time = timedelta(hours=severity * 8 if repairable else _VW_REPLACEMENT_HOURS)
+            rounded_severity = round(severity, 2)
+            
             for component_name in zone["affected_components"]:
                 # Map to VW component structure
-                vw_part = self._map_component_to_vw_part(component_name, vw_parts_map)
+                vw_part = self._map_component_to_vw_part(component_name)
+                category = vw_part["category"]
                 
-                component_damage = ComponentDamage(
+                vw_components.append(ComponentDamage(
                     component_id=component_name,
-                    damage_level=zone["severity"],
-                    damage_type=DamageType.STRUCTURAL if zone["severity"] > 0.5 else DamageType.COSMETIC,
+                    damage_level=severity,
+                    damage_type=damage_type,
+                    repairable=repairable,
+                    estimated_repair_time=repair_time,
                     vw_part_number=vw_part["part_code"],
-                    repair_category=vw_part["category"]
-                )
+                    repair_category=category
+                ))
                 
-                vw_components.append(component_damage)
-        
-        return vw_components
-    
-    def _map_component_to_vw_part(self, component_name: str, parts_map: Dict) -> Dict[str, str]:
-        """Map BeamNG component to VW part number"""
-        # Fuzzy matching for VW parts
-        for vw_part, part_info in parts_map.items():
-            if vw_part.lower() in component_name.lower():
-                return part_info
-        
-        # Default fallback
-        return {"part_code": "VW-MISC-001", "category": "miscellaneous"}
-    
-    async def _calculate_vw_repair_costs(self, components: List[ComponentDamage]) -> Dict[str, Any]:
-        """Calculate repair costs using VW parts pricing"""
-        start_time = datetime.now()
-        
-        # VW Brazil pricing (in Reais)
-        vw_pricing = {
-            "body_panel": {"base_cost": 1200.0, "labor_hours": 4.0},
-            "bumper": {"base_cost": 800.0, "labor_hours": 2.5},
-            "lighting": {"base_cost": 450.0, "labor_hours": 1.5},
-            "miscellaneous": {"base_cost": 300.0, "labor_hours": 1.0}
-        }
-        
-        labor_rate_brl = 85.0  # Brazilian labor rate per hour
-        
-        total_parts_cost = 0.0
-        total_labor_hours = 0.0
-        parts_list = []
-        
-        for component in components:
-            category = getattr(component, 'repair_category', 'miscellaneous')
-            pricing = vw_pricing.get(category, vw_pricing["miscellaneous"])
-            
-            # Calculate cost based on damage severity
-            damage_multiplier = getattr(component, 'damage_level', 0.5)
-            part_cost = pricing["base_cost"] * damage_multiplier
-            labor_hours = pricing["labor_hours"] * damage_multiplier
-            
-            total_parts_cost += part_cost
-            total_labor_hours += labor_hours
-            
-            parts_list.append({
-                "component": getattr(component, 'component_id', 'unknown'),
-                "vw_part_number": getattr(component, 'vw_part_number', 'VW-MISC-001'),
-                "category": category,
-                "estimated_cost_brl": round(part_cost, 2),
-                "labor_hours": round(labor_hours, 2),
-                "damage_severity": round(damage_multiplier, 2)
-            })
+                # Calculate cost based on damage severity
+                base_cost, base_labor_hours = _VW_PRICING.get(category, _DEFAULT_VW_PRICING)
+                part_cost = base_cost * severity
+                labor_hours = base_labor_hours * severity
+                
+                total_parts_cost += part_cost
+                total_labor_hours += labor_hours
+                
+                parts_list.append({
+                    "component": component_name,
+                    "vw_part_number": vw_part["part_code"],
+                    "category": category,
+                    "estimated_cost_brl": round(part_cost, 2),
+                    "labor_hours": round(labor_hours, 2),
+                    "damage_severity": rounded_severity
+                })
         
-        total_labor_cost = total_labor_hours * labor_rate_brl
+        total_labor_cost = total_labor_hours * _LABOR_RATE_BRL
         total_cost = total_parts_cost + total_labor_cost
         
         # Determine complexity
@@ -595,9 +640,9 @@ class VWBeamNGService:
         elif total_cost > 2000:
             complexity = "medium"
         
-        processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        processing_time = (time.perf_counter_ns() - start_time) // 1_000_000
         
-        return {
+        return vw_components, {
             "parts_cost_brl": round(total_parts_cost, 2),
             "labor_cost_brl": round(total_labor_cost, 2),
             "total_cost": round(total_cost, 2),
@@ -605,4 +650,8 @@ class VWBeamNGService:
             "complexity": complexity,
             "parts_list": parts_list,
             "processing_time": processing_time
-        }
\ No newline at end of file
+        }
+    
+    def _map_component_to_vw_part(self, component_name: str) -> Mapping[str, str]:
+        """Map BeamNG component to VW part number"""
+        return _vw_part_for_component(component_name)
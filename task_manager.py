@@ -4,67 +4,138 @@ VW Project Task Manager
 A Python utility to manage the project's Kanban board tasks.
 """
 
+import hashlib
 import json
+import mmap
 import os
+import re
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import Counter
+from itertools import chain
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Plain json still works when run outside the project environment
+    orjson = None
+
+# Numbered task IDs, as generated by add_task
+_TASK_ID_RE = re.compile(r'TASK-(\d+)')
+
+# Priority -> marker shown in task listings
+_PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_DEFAULT_PRIORITY_EMOJI = "⚪"
+
+def _today() -> str:
+    """Today's date as stored in tasks.json (YYYY-MM-DD)."""
+    return date.today().isoformat()
+
+def _orjson_load_mapped(f) -> Dict:
+    """Parse an open JSON file through a read-only memory map instead of copying it into bytes."""
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):  # Empty or unmappable file
+        return orjson.loads(f.read())
+    try:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
+    finally:
+        mapped.close()
+
+def _atomic_write(path: str, content: bytes):
+    """Replace path with content via a temp file, so readers never see a partial write."""
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(content)
+    os.replace(tmp, path)
 
 class TaskManager:
     def __init__(self, tasks_file: str = "tasks.json", board_file: str = "PROJECT_BOARD.md"):
         self.tasks_file = tasks_file
         self.board_file = board_file
         self.data = self.load_tasks()
+        self._rebuild_index()
+        self._stats_dirty = True  # Statistics need recomputing since the last update_statistics()
+        self._saved_digest = self._digest(self._serialize())  # Content as last loaded or saved
+    
+    def _rebuild_index(self):
+        """Index task IDs to (column, position) and find the highest TASK-NNN number."""
+        self._task_index: Dict[str, Tuple[str, int]] = {}
+        self._max_task_num = 0
+        for column_name, column in self.data['columns'].items():
+            for position, task in enumerate(column['tasks']):
+                self._task_index[task['id']] = (column_name, position)
+                match = _TASK_ID_RE.fullmatch(task['id'])
+                if match:
+                    self._max_task_num = max(self._max_task_num, int(match.group(1)))
     
     def load_tasks(self) -> Dict:
         """Load tasks from JSON file."""
         try:
+            if orjson is not None:
+                with open(self.tasks_file, 'rb') as f:
+                    return _orjson_load_mapped(f)
             with open(self.tasks_file, 'r') as f:
                 return json.load(f)
         except FileNotFoundError:
             print(f"❌ Error: {self.tasks_file} not found!")
             sys.exit(1)
     
+    def _serialize(self) -> bytes:
+        """Encode the board as written to tasks.json."""
+        if orjson is not None:
+            # Same 2-space layout as json.dump(indent=2), written as UTF-8 like the API does
+            return orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.data, indent=2).encode()
+    
+    @staticmethod
+    def _digest(content: bytes) -> bytes:
+        """Checksum of serialized board content."""
+        return hashlib.blake2b(content).digest()
+    
     def save_tasks(self):
-        """Save tasks to JSON file."""
+        """Save tasks to JSON file (a no-op when the content is unchanged since loading)."""
         self.update_statistics()
-        self.data['project']['lastUpdated'] = datetime.now().strftime("%Y-%m-%d")
         
-        with open(self.tasks_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        # Compare before bumping lastUpdated, which alone would always differ
+        content = self._serialize()
+        if self._digest(content) == self._saved_digest:
+            print(f"ℹ️  No changes to save to {self.tasks_file}")
+            return
+        
+        self.data['project']['lastUpdated'] = _today()
+        content = self._serialize()
+        _atomic_write(self.tasks_file, content)
+        self._saved_digest = self._digest(content)
         print(f"✅ Tasks saved to {self.tasks_file}")
     
     def update_statistics(self):
-        """Update project statistics."""
-        stats = {
-            'totalTasks': 0,
-            'completedTasks': 0,
-            'inProgressTasks': 0,
-            'todoTasks': 0,
-            'backlogTasks': 0,
-            'totalEstimatedHours': 0,
-            'completedHours': 0,
-            'remainingHours': 0
-        }
+        """Update project statistics (skipped when no task changed since the last update)."""
+        if not self._stats_dirty:
+            return
         
-        for column in self.data['columns'].values():
-            for task in column['tasks']:
-                stats['totalTasks'] += 1
-                
-                if task['status'] == 'done':
-                    stats['completedTasks'] += 1
-                    stats['completedHours'] += task.get('actualHours', task.get('estimatedHours', 0))
-                elif task['status'] == 'inProgress':
-                    stats['inProgressTasks'] += 1
-                elif task['status'] == 'todo':
-                    stats['todoTasks'] += 1
-                elif task['status'] == 'backlog':
-                    stats['backlogTasks'] += 1
-                
-                stats['totalEstimatedHours'] += task.get('estimatedHours', 0)
+        # One pass over the lazily chained columns; no flattened task list is built
+        status_counts = Counter()
+        total_hours = completed_hours = 0
+        for task in chain.from_iterable(column['tasks'] for column in self.data['columns'].values()):
+            status = task['status']
+            status_counts[status] += 1
+            total_hours += task.get('estimatedHours', 0)
+            if status == 'done':
+                completed_hours += task.get('actualHours', task.get('estimatedHours', 0))
         
-        stats['remainingHours'] = stats['totalEstimatedHours'] - stats['completedHours']
-        self.data['statistics'] = stats
+        self.data['statistics'] = {
+            'totalTasks': sum(status_counts.values()),
+            'completedTasks': status_counts['done'],
+            'inProgressTasks': status_counts['inProgress'],
+            'todoTasks': status_counts['todo'],
+            'backlogTasks': status_counts['backlog'],
+            'totalEstimatedHours': total_hours,
+            'completedHours': completed_hours,
+            'remainingHours': total_hours - completed_hours
+        }
+        self._stats_dirty = False
     
     def add_task(self, title: str, description: str, priority: str = "medium", 
                 estimated_hours: int = 4, labels: List[str] = None, 
@@ -74,17 +145,8 @@ class TaskManager:
             labels = []
         
         # Generate task ID
-        existing_ids = []
-        for column in self.data['columns'].values():
-            for task in column['tasks']:
-                if task['id'].startswith('TASK-'):
-                    try:
-                        num = int(task['id'].split('-')[1])
-                        existing_ids.append(num)
-                    except:
-                        pass
-        
-        new_id = f"TASK-{max(existing_ids, default=0) + 1:03d}"
+        self._max_task_num += 1
+        new_id = f"TASK-{self._max_task_num:03d}"
         
         new_task = {
             "id": new_id,
@@ -94,76 +156,94 @@ class TaskManager:
             "estimatedHours": estimated_hours,
             "labels": labels,
             "assignee": assignee,
-            "createdDate": datetime.now().strftime("%Y-%m-%d"),
+            "createdDate": _today(),
             "dueDate": None,
             "dependencies": [],
             "status": status.lower()
         }
         
         # Add to appropriate column
-        self.data['columns'][status]['tasks'].append(new_task)
+        tasks = self.data['columns'][status]['tasks']
+        tasks.append(new_task)
+        self._task_index[new_id] = (status, len(tasks) - 1)
+        self._stats_dirty = True
         print(f"✅ Task {new_id} added: {title}")
         return new_id
     
     def move_task(self, task_id: str, new_status: str) -> bool:
         """Move a task to a different status."""
-        task = self.find_task(task_id)
-        if not task:
+        location = self._task_index.get(task_id)
+        if location is None:
             print(f"❌ Task {task_id} not found!")
             return False
         
-        # Remove from current column
-        for column in self.data['columns'].values():
-            column['tasks'] = [t for t in column['tasks'] if t['id'] != task_id]
+        # Remove from current column; tasks after it shift up one position
+        old_column, position = location
+        old_tasks = self.data['columns'][old_column]['tasks']
+        task = old_tasks.pop(position)
+        for shifted_position in range(position, len(old_tasks)):
+            self._task_index[old_tasks[shifted_position]['id']] = (old_column, shifted_position)
         
         # Update task status
         task['status'] = new_status.lower()
         
         # Add completion date if moving to done
         if new_status.lower() == 'done':
-            task['completedDate'] = datetime.now().strftime("%Y-%m-%d")
+            task['completedDate'] = _today()
         
         # Add to new column
-        self.data['columns'][new_status]['tasks'].append(task)
+        new_tasks = self.data['columns'][new_status]['tasks']
+        new_tasks.append(task)
+        self._task_index[task_id] = (new_status, len(new_tasks) - 1)
+        self._stats_dirty = True
         print(f"✅ Task {task_id} moved to {new_status}")
         return True
     
     def find_task(self, task_id: str) -> Optional[Dict]:
         """Find a task by ID."""
-        for column in self.data['columns'].values():
-            for task in column['tasks']:
-                if task['id'] == task_id:
-                    return task
-        return None
+        location = self._task_index.get(task_id)
+        if location is None:
+            return None
+        column_name, position = location
+        return self.data['columns'][column_name]['tasks'][position]
     
     def list_tasks(self, status: str = None):
         """List all tasks or tasks with specific status."""
         if status:
             if status in self.data['columns']:
-                tasks = self.data['columns'][status]['tasks']
-                print(f"\n📋 Tasks in {status.upper()}:")
-                for task in tasks:
-                    self.print_task(task)
+                lines = [f"\n📋 Tasks in {status.upper()}:"]
+                for task in self.data['columns'][status]['tasks']:
+                    lines.extend(self.format_task(task))
             else:
-                print(f"❌ Invalid status: {status}")
+                lines = [f"❌ Invalid status: {status}"]
         else:
-            print("\n📋 ALL TASKS:")
+            lines = ["\n📋 ALL TASKS:"]
             for column_name, column in self.data['columns'].items():
                 if column['tasks']:
-                    print(f"\n{column['icon']} {column['name']}:")
+                    lines.append(f"\n{column['icon']} {column['name']}:")
                     for task in column['tasks']:
-                        self.print_task(task)
+                        lines.extend(self.format_task(task))
+        
+        # One write for the whole listing rather than a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def print_task(self, task: Dict):
-        """Print task information."""
-        priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(task.get('priority'), '⚪')
-        print(f"  {priority_emoji} {task['id']}: {task['title']}")
-        print(f"      📝 {task['description']}")
+    def format_task(self, task: Dict) -> List[str]:
+        """Format task information as output lines (ending with a blank line)."""
+        priority_emoji = _PRIORITY_EMOJI.get(task.get('priority'), _DEFAULT_PRIORITY_EMOJI)
+        lines = [
+            f"  {priority_emoji} {task['id']}: {task['title']}",
+            f"      📝 {task['description']}"
+        ]
         if task.get('labels'):
-            print(f"      🏷️  {', '.join(task['labels'])}")
+            lines.append(f"      🏷️  {', '.join(task['labels'])}")
         if task.get('estimatedHours'):
-            print(f"      ⏱️  {task['estimatedHours']}h estimated")
-        print()
+            lines.append(f"      ⏱️  {task['estimatedHours']}h estimated")
+        lines.append("")
+        return lines
+    
+    def print_task(self, task: Dict):
+        """Print task information."""
+        sys.stdout.write("\n".join(self.format_task(task)) + "\n")
     
     def show_statistics(self):
         """Show project statistics."""
@@ -182,6 +262,65 @@ class TaskManager:
         print(f"⏳ Remaining:    {stats['remainingHours']}")
 
 
+def _cmd_list(manager: TaskManager, argv: List[str]):
+    status = argv[2] if len(argv) > 2 else None
+    manager.list_tasks(status)
+
+def _cmd_add(manager: TaskManager, argv: List[str]):
+    if len(argv) < 3:
+        print("❌ Please provide task title")
+        return
+    
+    title = " ".join(argv[2:])
+    print(f"Adding task: {title}")
+    description = input("Description: ")
+    priority = input("Priority (low/medium/high) [medium]: ") or "medium"
+    try:
+        hours = int(input("Estimated hours [4]: ") or "4")
+    except:
+        hours = 4
+    labels_raw = input("Labels (comma-separated): ")
+    labels = [l.strip() for l in labels_raw.split(",") if l.strip()]
+    
+    manager.add_task(title, description, priority, hours, labels)
+    manager.save_tasks()
+
+def _cmd_move(manager: TaskManager, argv: List[str]):
+    if len(argv) < 4:
+        print("❌ Usage: move <task_id> <new_status>")
+        return
+    
+    task_id = argv[2].upper()
+    new_status = argv[3].lower()
+    
+    if manager.move_task(task_id, new_status):
+        manager.save_tasks()
+
+def _cmd_stats(manager: TaskManager, argv: List[str]):
+    manager.show_statistics()
+
+def _cmd_find(manager: TaskManager, argv: List[str]):
+    if len(argv) < 3:
+        print("❌ Usage: find <task_id>")
+        return
+    
+    task_id = argv[2].upper()
+    task = manager.find_task(task_id)
+    if task:
+        print(f"\n📋 Task {task_id}:")
+        manager.print_task(task)
+    else:
+        print(f"❌ Task {task_id} not found!")
+
+# CLI command name -> handler(manager, argv)
+_COMMANDS = {
+    "list": _cmd_list,
+    "add": _cmd_add,
+    "move": _cmd_move,
+    "stats": _cmd_stats,
+    "find": _cmd_find
+}
+
 def main():
     """Main CLI interface."""
     manager = TaskManager()
@@ -200,60 +339,12 @@ def main():
         return
     
     command = sys.argv[1].lower()
-    
-    if command == "list":
-        status = sys.argv[2] if len(sys.argv) > 2 else None
-        manager.list_tasks(status)
-    
-    elif command == "add":
-        if len(sys.argv) < 3:
-            print("❌ Please provide task title")
-            return
-        
-        title = " ".join(sys.argv[2:])
-        print(f"Adding task: {title}")
-        description = input("Description: ")
-        priority = input("Priority (low/medium/high) [medium]: ") or "medium"
-        try:
-            hours = int(input("Estimated hours [4]: ") or "4")
-        except:
-            hours = 4
-        labels = input("Labels (comma-separated): ").split(",") if input("Labels (comma-separated): ") else []
-        labels = [l.strip() for l in labels if l.strip()]
-        
-        manager.add_task(title, description, priority, hours, labels)
-        manager.save_tasks()
-    
-    elif command == "move":
-        if len(sys.argv) < 4:
-            print("❌ Usage: move <task_id> <new_status>")
-            return
-        
-        task_id = sys.argv[2].upper()
-        new_status = sys.argv[3].lower()
-        
-        if manager.move_task(task_id, new_status):
-            manager.save_tasks()
-    
-    elif command == "stats":
-        manager.show_statistics()
-    
-    elif command == "find":
-        if len(sys.argv) < 3:
-            print("❌ Usage: find <task_id>")
-            return
-        
-        task_id = sys.argv[2].upper()
-        task = manager.find_task(task_id)
-        if task:
-            print(f"\n📋 Task {task_id}:")
-            manager.print_task(task)
-        else:
-            print(f"❌ Task {task_id} not found!")
-    
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         print(f"❌ Unknown command: {command}")
+        return
+    handler(manager, sys.argv)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
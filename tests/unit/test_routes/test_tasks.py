@@ -0,0 +1,119 @@
+"""Test task board statistics bookkeeping."""
+
+import asyncio
+import copy
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes import tasks
+
+
+def _task(task_id: str, status: str, estimated: int, actual=None) -> dict:
+    task = {"id": task_id, "title": task_id, "status": status, "estimatedHours": estimated}
+    if actual is not None:
+        task["actualHours"] = actual
+    return task
+
+
+def _board() -> dict:
+    """A small board in the tasks.json file layout, with stale statistics."""
+    return {
+        "project": {"name": "Test", "created": "2026-01-01", "lastUpdated": "2026-01-01"},
+        "columns": {
+            "todo": {"title": "To Do", "tasks": [_task("T-1", "todo", 4), _task("T-2", "todo", 6)]},
+            "inProgress": {"title": "In Progress", "tasks": [_task("T-3", "inProgress", 5)]},
+            "review": {"title": "Review", "tasks": [_task("T-4", "review", 3)]},
+            "done": {"title": "Done", "tasks": [_task("T-5", "done", 2, actual=3)]},
+            "backlog": {"title": "Backlog", "tasks": [_task("T-6", "backlog", 10)]}
+        },
+        "statistics": {"totalTasks": 1, "completedTasks": 0}
+    }
+
+
+@pytest.fixture
+def tasks_file(tmp_path, monkeypatch):
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps(_board()))
+    monkeypatch.setattr(tasks, "_TASKS_FILE", path)
+    tasks._discard_unsaved()
+    yield path
+    tasks._discard_unsaved()
+
+
+def test_reload_recounts_statistics(tasks_file):
+    """Test a freshly parsed file gets its statistics recounted, keeping lastUpdated."""
+    data = tasks._load_tasks()
+
+    expected = copy.deepcopy(data)
+    tasks.update_statistics(expected)
+    assert data["statistics"] == expected["statistics"]
+    assert data["statistics"]["totalTasks"] == 6
+    assert data["project"]["lastUpdated"] == "2026-01-01"
+
+
+def _move(data: dict, task_id: str, new_status: str) -> None:
+    """Move a task between in-memory columns and apply the statistics delta."""
+    old_status = tasks._CACHE["index"][task_id]
+    task = data["columns"][old_status]["tasks"].pop(task_id)
+    task["status"] = new_status
+    data["columns"][new_status]["tasks"][task_id] = task
+    tasks._CACHE["index"][task_id] = new_status
+    tasks.apply_move_delta(data, task, old_status, new_status)
+
+
+def test_move_deltas_match_full_recount(tasks_file):
+    """Test per-move statistics deltas agree with a full recount after every move."""
+    data = tasks._load_tasks()
+    moves = [
+        ("T-1", "review"),      # todo -> review (no counter)
+        ("T-4", "done"),        # review -> done
+        ("T-5", "review"),      # done -> review, with actualHours
+        ("T-3", "done"),        # inProgress -> done
+        ("T-6", "todo"),        # backlog -> todo
+        ("T-4", "inProgress"),  # done -> inProgress
+        ("T-2", "todo"),        # unchanged status
+        ("T-1", "done")         # review -> done
+    ]
+    for task_id, new_status in moves:
+        _move(data, task_id, new_status)
+
+        expected = copy.deepcopy(data)
+        tasks.update_statistics(expected)
+        assert data["statistics"] == expected["statistics"], (task_id, new_status)
+
+
+def _statuses_on_disk(path) -> dict:
+    board = json.loads(path.read_text())
+    return {task["id"]: task["status"] for column in board["columns"].values() for task in column["tasks"]}
+
+
+def test_concurrent_moves_are_all_saved(tasks_file):
+    """Test moves issued together are each applied and written to disk."""
+    async def move_all():
+        await asyncio.gather(
+            tasks.move_task("T-1", "inProgress"),
+            tasks.move_task("T-2", "done"),
+            tasks.move_task("T-6", "review")
+        )
+
+    asyncio.run(move_all())
+
+    statuses = _statuses_on_disk(tasks_file)
+    assert (statuses["T-1"], statuses["T-2"], statuses["T-6"]) == ("inProgress", "done", "review")
+    assert json.loads(tasks_file.read_text())["statistics"]["completedTasks"] == 2
+
+
+def test_failed_save_returns_500_and_reloads(tasks_file, monkeypatch):
+    """Test a failed write surfaces as a 500 and the unsaved move is dropped."""
+    def fail_write(path, content):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tasks, "_atomic_write", fail_write)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tasks.move_task("T-1", "done"))
+    assert exc_info.value.status_code == 500
+
+    assert tasks._CACHE["data"] is None
+    assert tasks._load_tasks()["columns"]["todo"]["tasks"]["T-1"]["status"] == "todo"
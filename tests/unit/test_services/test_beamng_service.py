@@ -0,0 +1,68 @@
+"""Test the VW BeamNG damage report pipeline."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from src.models import BeamNGSession, BeamNGTelemetry, DamageType, VWDamageReport
+from src.services import VWBeamNGService
+
+
+def _service_with_session() -> VWBeamNGService:
+    service = VWBeamNGService()
+    service.current_session = BeamNGSession(
+        session_id="test_session",
+        vehicle_model="tcross",
+        scenario="frontal_collision",
+        start_time=datetime.now()
+    )
+    return service
+
+
+def _mock_telemetry() -> BeamNGTelemetry:
+    return BeamNGTelemetry(
+        session_id="test_session",
+        timestamp=datetime.now(),
+        vehicle_position=(0.0, 0.0, 0.0),
+        vehicle_velocity=13.9,
+        damage_data={
+            "front_bumper": 0.9,
+            "hood": 0.6,
+            "left_door": 0.3,
+            "roof": 0.0
+        }
+    )
+
+
+def test_generate_vw_damage_report_from_mock_telemetry():
+    """Test the report is built from mock telemetry with valid component damages."""
+    report = asyncio.run(_service_with_session().generate_vw_damage_report(_mock_telemetry()))
+
+    assert isinstance(report, VWDamageReport)
+    assert report.session_id == "test_session"
+    assert report.vehicle_model == "tcross"
+    assert [zone["zone"] for zone in report.impact_zones] == ["front", "side_left"]
+    assert report.estimated_cost > 0
+    assert report.processing_metadata["telemetry_points"] == 4
+
+    components = {comp.component_id: comp for comp in report.component_damages}
+    assert set(components) == {"front_bumper", "hood", "left_door"}
+
+    # Front zone peaks at 0.9: structural and past repair
+    front = components["hood"]
+    assert front.damage_type is DamageType.DEFORMATION
+    assert front.repairable is False
+    assert front.estimated_repair_time == timedelta(hours=2)
+
+    side = components["left_door"]
+    assert side.damage_type is DamageType.SCRATCHING
+    assert side.repairable is True
+    assert side.estimated_repair_time == timedelta(hours=0.3 * 8)
+
+
+def test_vw_components_carry_part_mapping():
+    """Test components carry the mapped VW part number and repair category."""
+    report = asyncio.run(_service_with_session().generate_vw_damage_report(_mock_telemetry()))
+
+    for comp in report.component_damages:
+        assert comp.vw_part_number != "VW-UNKNOWN"
+        assert comp.repair_category != "miscellaneous"